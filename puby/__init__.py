@@ -2,11 +2,18 @@
 
 __version__ = "0.1.0"
 
-from .client import PublicationClient
-from .env import get_api_key
-from .matcher import PublicationMatcher
-from .models import Author, Publication
-from .sources import ORCIDSource, PureSource, ScholarSource
+# Public API, resolved on first access (PEP 562) so that ``import puby``
+# does not eagerly load the source modules and their HTTP dependencies
+_LAZY_EXPORTS = {
+    "Author": ".models",
+    "ORCIDSource": ".sources",
+    "Publication": ".models",
+    "PublicationClient": ".client",
+    "PublicationMatcher": ".matcher",
+    "PureSource": ".sources",
+    "ScholarSource": ".sources",
+    "get_api_key": ".env",
+}
 
 __all__ = [
     "Author",
@@ -18,3 +25,21 @@ __all__ = [
     "ScholarSource",
     "get_api_key",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import public API members lazily on first attribute access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily imported public names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
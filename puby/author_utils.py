@@ -1,6 +1,7 @@
 """Shared utilities for author parsing and handling."""
 
-import re
+import sys
+from functools import lru_cache
 from typing import List, Optional
 
 from .models import Author
@@ -16,14 +17,16 @@ def parse_comma_separated_authors(author_text: str) -> List[Author]:
         List of Author objects
     """
     authors = []
-    if author_text and author_text.strip():
-        # Split by comma and clean up
-        author_names = [name.strip() for name in author_text.split(",")]
-        for name in author_names:
+    if author_text:
+        # Single-author fast path: nothing to split
+        if "," not in author_text:
+            return parse_plain_author_names([author_text])
+
+        # Split by comma, stripping each name exactly once
+        for name in author_text.split(","):
+            name = name.strip()
             if name and not _is_separator_word(name):
-                author = _create_author_from_name(name)
-                if author:
-                    authors.append(author)
+                authors.append(_parse_name(name))
     return authors
 
 
@@ -37,15 +40,17 @@ def parse_bibtex_authors(author_string: str) -> List[Author]:
         List of Author objects with proper given/family name parsing
     """
     authors = []
-    if author_string and author_string.strip():
-        # Split by " and " (BibTeX standard)
-        author_parts = author_string.split(" and ")
-        for author_part in author_parts:
+    if author_string:
+        # Single-author fast path: nothing to split
+        if " and " not in author_string:
+            return parse_plain_author_names([author_string])
+
+        # Split by " and " (BibTeX standard), stripping each part exactly once.
+        # Both "Last, First" and "First Last" forms are handled by _parse_name.
+        for author_part in author_string.split(" and "):
             author_part = author_part.strip()
             if author_part and not _is_separator_word(author_part):
-                author = _parse_bibtex_name_format(author_part)
-                if author:
-                    authors.append(author)
+                authors.append(_parse_name(author_part))
     return authors
 
 
@@ -60,10 +65,9 @@ def parse_plain_author_names(names: List[str]) -> List[Author]:
     """
     authors = []
     for name in names:
-        if name and name.strip() and not _is_separator_word(name):
-            author = _create_author_from_name(name.strip())
-            if author:
-                authors.append(author)
+        name = name.strip() if name else ""
+        if name and not _is_separator_word(name):
+            authors.append(_parse_name(name))
     return authors
 
 
@@ -90,7 +94,7 @@ def create_structured_author(
     # If we have both first and last names, use them
     if last_clean or first_clean:
         display_name = f"{first_clean} {last_clean}".strip()
-        return Author(
+        return _build_author(
             name=display_name,
             given_name=first_clean or None,
             family_name=last_clean or None,
@@ -98,7 +102,7 @@ def create_structured_author(
     
     # Fallback to full name if provided
     if full_clean:
-        return _create_author_from_name(full_clean)
+        return _parse_name(full_clean)
     
     return None
 
@@ -115,47 +119,53 @@ def create_fallback_author(fallback_text: str = "[No authors]") -> Author:
     return Author(name=fallback_text)
 
 
-def _create_author_from_name(name: str) -> Optional[Author]:
-    """Create Author object from a single name string, attempting to parse components.
+# Words that appear between author names and are not names themselves
+_SEPARATOR_WORDS = frozenset(("and", "&", "et", "al", "et al", "et al."))
+
+
+@lru_cache(maxsize=4096)
+def _parse_name(name: str) -> Author:
+    """Parse a name into an Author.
+    
+    Callers strip the name once at the boundary and skip empty strings, so
+    this helper does not re-strip its input.
+    
+    Co-author names recur across a researcher's publications, so results are
+    cached and each distinct name string is only parsed once. Author is
+    immutable, so the cached instance can be shared safely.
     
     Args:
-        name: Full name string in various formats
+        name: Name in "Last, First" or "First ... Last" format
         
     Returns:
-        Author object or None if name is invalid
+        Author object with parsed components
     """
-    name = name.strip()
-    if not name:
-        return None
-    
-    # Check for "Last, First" format
-    if "," in name:
-        return _parse_last_first_format(name)
+    # A single partition both detects and splits "Last, First" format
+    family_name, sep, given_name = name.partition(",")
+    if sep:
+        return _parse_last_first_format(family_name.strip(), given_name.strip())
     
     # Otherwise assume "First ... Last" format
     return _parse_first_last_format(name)
 
 
-def _parse_last_first_format(name: str) -> Author:
-    """Parse name in 'Last, First' format.
+def _parse_last_first_format(family_name: str, given_name: str) -> Author:
+    """Build Author from the stripped halves of a 'Last, First' name.
     
     Args:
-        name: Name in format "Last, First Middle"
+        family_name: Part before the comma, e.g. "Last"
+        given_name: Part after the comma, e.g. "First Middle"
         
     Returns:
         Author object with parsed components
     """
-    parts = name.split(",", 1)
-    family_name = parts[0].strip()
-    given_name = parts[1].strip() if len(parts) > 1 else ""
-    
     # Reconstruct full name in natural order
     if given_name:
         full_name = f"{given_name} {family_name}".strip()
     else:
         full_name = family_name
     
-    return Author(
+    return _build_author(
         name=full_name,
         given_name=given_name or None,
         family_name=family_name or None,
@@ -173,50 +183,56 @@ def _parse_first_last_format(name: str) -> Author:
     """
     words = name.split()
     if not words:
-        return Author(name=name)
+        return _build_author(name=name)
     
     if len(words) == 1:
         # Single word - treat as family name
-        return Author(name=name, family_name=name)
+        return _build_author(name=name, family_name=name)
     
     # Multiple words - last is family, rest is given
     family_name = words[-1]
     given_name = " ".join(words[:-1])
     
-    return Author(
+    return _build_author(
         name=name,
         given_name=given_name,
         family_name=family_name,
     )
 
 
-def _parse_bibtex_name_format(author_part: str) -> Optional[Author]:
-    """Parse a single author from BibTeX format.
+def _build_author(
+    name: str,
+    given_name: Optional[str] = None,
+    family_name: Optional[str] = None,
+) -> Author:
+    """Create Author with interned name strings.
+    
+    The same collaborators appear across many publications, often in
+    different formats ("Smith, John" vs "John Smith"). Interning lets all
+    of those Author objects share one copy of each name string.
     
     Args:
-        author_part: Single author string from BibTeX
+        name: Display name
+        given_name: Given name (optional)
+        family_name: Family name (optional)
         
     Returns:
-        Author object or None if invalid
+        Author object
     """
-    if not author_part.strip():
-        return None
-    
-    # BibTeX format is typically "Last, First" or "First Last"
-    if "," in author_part:
-        return _parse_last_first_format(author_part)
-    else:
-        return _parse_first_last_format(author_part)
+    return Author(
+        name=sys.intern(name),
+        given_name=sys.intern(given_name) if given_name else None,
+        family_name=sys.intern(family_name) if family_name else None,
+    )
 
 
 def _is_separator_word(text: str) -> bool:
     """Check if text is a separator word that should be ignored.
     
     Args:
-        text: Text to check
+        text: Text to check, already stripped by the caller
         
     Returns:
         True if text is a separator word like "and", "&"
     """
-    text_lower = text.lower().strip()
-    return text_lower in ("and", "&", "et", "al", "et al", "et al.")
\ No newline at end of file
+    return text.lower() in _SEPARATOR_WORDS
\ No newline at end of file
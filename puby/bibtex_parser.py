@@ -1,92 +1,215 @@
 """BibTeX parsing utilities for Zotero My Publications endpoint."""
 
-import re
-from typing import List, Optional
+from typing import AbstractSet, Dict, Iterator, List, Optional, Union
 
 from .models import Author, Publication
-from .utils import extract_year_from_bibtex_field
 from .author_utils import parse_bibtex_authors
 
+# Fields read by BibtexParser.parse_bibtex_entry
+_PUBLICATION_FIELDS = frozenset(
+    ("title", "author", "year", "journal", "doi", "volume", "pages")
+)
+
+
+def _find_closing_brace(entry: str, start: int) -> int:
+    """Return the index of the brace closing the group opened before start.
+
+    Nested groups such as ``{The {GPU} Approach}`` are balanced. Returns -1
+    if the group is never closed.
+    """
+    depth = 1
+    pos = start
+    while True:
+        close = entry.find("}", pos)
+        if close < 0:
+            return -1
+        open_ = entry.find("{", pos, close)
+        if open_ >= 0:
+            depth += 1
+            pos = open_ + 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return close
+        pos = close + 1
+
+
+def _scan_fields(
+    entry: str, wanted: Optional[AbstractSet[str]] = None
+) -> Dict[str, str]:
+    """Scan a BibTeX entry body once and collect its ``key = value`` fields.
+
+    Handles braced (``{...}``), quoted (``"..."``) and bare values. Keys are
+    lowercased; the first occurrence of a key wins and empty values are
+    skipped.
+
+    Args:
+        entry: Entry text following the ``@type{`` header
+        wanted: Optional set of field names to collect. When given, other
+            fields are skipped and scanning stops once all have been found.
+
+    Returns:
+        Dictionary mapping lowercased field names to raw values
+    """
+    fields: Dict[str, str] = {}
+    find = entry.find
+    length = len(entry)
+    pos = 0
+
+    while True:
+        eq = find("=", pos)
+        if eq < 0:
+            break
+
+        # The key is whatever follows the previous comma (or the cite key)
+        key = entry[pos:eq].rsplit(",", 1)[-1].strip().lower()
+
+        start = eq + 1
+        while start < length and entry[start].isspace():
+            start += 1
+        if start >= length:
+            break
+
+        # Locate the value first; only slice it out if the key is kept
+        first = entry[start]
+        bare = False
+        if first == "{":
+            start += 1
+            end = _find_closing_brace(entry, start)
+            pos = end + 1
+        elif first == '"':
+            start += 1
+            end = find('"', start)
+            pos = end + 1
+        else:
+            bare = True
+            end = find(",", start)
+            pos = end
+        if end < 0:
+            end = pos = length
+
+        if not key or key in fields or (wanted is not None and key not in wanted):
+            continue
+
+        value = entry[start:end]
+        if bare:
+            value = value.strip().rstrip("}").rstrip()
+
+        if value:
+            fields[key] = value
+            if wanted is not None and len(fields) == len(wanted):
+                break
+
+    return fields
+
+
+def _iter_entries(content: str) -> Iterator[str]:
+    """Yield the body of each ``@type{...}`` entry in a BibTeX document.
+
+    Entries are located with ``str.find`` and delimited by brace balancing,
+    so values containing nested braces stay within their entry.
+
+    Args:
+        content: Full BibTeX document
+
+    Yields:
+        Entry text between the opening and closing braces
+    """
+    at = content.find("@")
+    while at >= 0:
+        brace = content.find("{", at)
+        if brace < 0:
+            return
+
+        # Only "@name{" headers start an entry; skip stray "@" characters
+        entry_type = content[at + 1 : brace].rstrip()
+        if not entry_type.replace("_", "").isalnum():
+            at = content.find("@", at + 1)
+            continue
+
+        end = _find_closing_brace(content, brace + 1)
+        if end < 0:
+            yield content[brace + 1 :]
+            return
+
+        yield content[brace + 1 : end]
+        at = content.find("@", end + 1)
+
 
 class BibtexParser:
     """Parser for BibTeX entries from Zotero My Publications."""
 
-    def __init__(self, logger=None):
-        """Initialize parser with optional logger."""
+    def __init__(self, logger=None, keep_raw: bool = False):
+        """Initialize parser with optional logger.
+
+        Args:
+            logger: Optional logger for parse warnings and errors
+            keep_raw: Store each entry's source text in ``raw_data["bibtex"]``.
+                Off by default so entry strings are not retained in memory.
+        """
         self.logger = logger
+        self.keep_raw = keep_raw
 
-    def parse_bibtex_response(self, bibtex_content: str) -> List[Publication]:
+    def parse_bibtex_response(
+        self, bibtex_content: Union[str, bytes]
+    ) -> List[Publication]:
         """Parse BibTeX response containing multiple entries."""
-        publications = []
+        return list(self.iter_bibtex_response(bibtex_content))
+
+    def iter_bibtex_response(
+        self, bibtex_content: Union[str, bytes]
+    ) -> Iterator[Publication]:
+        """Lazily parse BibTeX response, yielding one publication at a time.
 
-        # Split on @article, @book, etc.
-        entries = re.split(r"@\w+\s*\{", bibtex_content)
+        Useful for streaming consumers that do not need every publication
+        in memory at once. Raw response bytes are decoded as UTF-8.
+        """
+        if isinstance(bibtex_content, bytes):
+            bibtex_content = bibtex_content.decode("utf-8", errors="replace")
 
-        for entry in entries[1:]:  # Skip first empty split
+        for entry in _iter_entries(bibtex_content):
             try:
                 pub = self.parse_bibtex_entry(entry)
                 if pub:
                     pub.source = "Zotero My Publications"
-                    publications.append(pub)
+                    yield pub
             except Exception as e:
                 if self.logger:
                     self.logger.warning(f"Failed to parse BibTeX entry: {e}")
                 continue
 
-        return publications
-
     def parse_bibtex_entry(self, entry: str) -> Optional[Publication]:
         """Parse a single BibTeX entry into Publication."""
         try:
-            # Extract title
-            title_match = re.search(r"title\s*=\s*\{([^}]+)\}", entry, re.IGNORECASE)
-            title = title_match.group(1) if title_match else ""
+            # Walk the entry once and collect the fields we need
+            fields = _scan_fields(entry, _PUBLICATION_FIELDS)
 
+            title = fields.get("title", "")
             if not title:
                 return None
 
-            # Extract and parse authors
-            authors = self._parse_bibtex_authors(entry)
+            # Parse authors using shared utilities
+            authors = parse_bibtex_authors(fields.get("author", ""))
             if not authors:
                 authors = [Author(name="[No authors]")]
 
-            # Extract other fields
-            year = self._extract_bibtex_year(entry)
-            journal = self._extract_bibtex_field(entry, "journal")
-            doi = self._extract_bibtex_field(entry, "doi")
-            volume = self._extract_bibtex_field(entry, "volume")
-            pages = self._extract_bibtex_field(entry, "pages")
+            # Plain digit check instead of int() with exception handling
+            year_str = fields.get("year", "").strip()
+            year = int(year_str) if year_str.isascii() and year_str.isdigit() else None
 
             return Publication(
                 title=title,
                 authors=authors,
                 year=year,
-                journal=journal,
-                doi=doi,
-                volume=volume,
-                pages=pages,
+                journal=fields.get("journal"),
+                doi=fields.get("doi"),
+                volume=fields.get("volume"),
+                pages=fields.get("pages"),
                 source="Zotero My Publications",
-                raw_data={"bibtex": entry},
+                raw_data={"bibtex": entry} if self.keep_raw else {},
             )
 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error parsing BibTeX entry: {e}")
             return None
-
-    def _parse_bibtex_authors(self, entry: str) -> List[Author]:
-        """Parse authors from BibTeX entry using shared utilities."""
-        author_match = re.search(r"author\s*=\s*\{([^}]+)\}", entry, re.IGNORECASE)
-        author_str = author_match.group(1) if author_match else ""
-        
-        return parse_bibtex_authors(author_str)
-
-    def _extract_bibtex_year(self, entry: str) -> Optional[int]:
-        """Extract year from BibTeX entry."""
-        return extract_year_from_bibtex_field(entry)
-
-    def _extract_bibtex_field(self, entry: str, field_name: str) -> Optional[str]:
-        """Extract a field value from BibTeX entry."""
-        pattern = rf"{field_name}\s*=\s*\{{([^}}]+)\}}"
-        match = re.search(pattern, entry, re.IGNORECASE)
-        return match.group(1) if match else None
@@ -1,29 +1,96 @@
 """Command-line interface for puby."""
 
+import importlib
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
 import click
-from colorama import init as colorama_init
 
-from .commands.check import check
-from .commands.fetch import fetch
 
-# Initialize colorama for cross-platform colored output
-colorama_init()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when invoked.
 
+    The command modules pull in every source backend (requests, pyzotero,
+    BeautifulSoup), which is wasted work for ``--help`` or ``--version``.
+    """
 
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        lazy_help: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize group.
 
+        Args:
+            lazy_subcommands: Mapping of command name to "module:attribute"
+            lazy_help: Mapping of command name to the help shown in the
+                group's command list, so ``--help`` does not import commands
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
 
-@click.group()
-@click.version_option(version="0.1.0", prog_name="puby")
-def cli() -> None:
-    """Puby - Publication list management tool for researchers."""
-    pass
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager and lazy commands without importing the lazy ones."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return command, importing its module on first use."""
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name, __package__)
+            command: click.Command = getattr(module, attr_name)
+            return command
+        return super().get_command(ctx, cmd_name)
 
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Write the command list, taking lazy commands' help from lazy_help."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
 
-# Add commands to the CLI group
-cli.add_command(check)
-cli.add_command(fetch)
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows: List[Tuple[str, str]] = []
+        for name in names:
+            if name in self.lazy_help:
+                # Stand-in command that only carries the help text
+                cmd: Optional[click.Command] = click.Command(
+                    name, help=self.lazy_help[name]
+                )
+            else:
+                cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
 
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "check": ".commands.check:check",
+        "fetch": ".commands.fetch:fetch",
+    },
+    lazy_help={
+        "check": "Compare publications across sources and identify missing "
+        "or duplicate entries.",
+        "fetch": "Fetch publications from ORCID and save to BibTeX file.",
+    },
+)
+@click.version_option(version="0.1.0", prog_name="puby")
+def cli() -> None:
+    """Puby - Publication list management tool for researchers."""
+    # Initialize colorama for cross-platform colored output on terminals only
+    if sys.stdout.isatty():
+        from colorama import init as colorama_init
 
+        colorama_init()
 
 
 def main() -> None:
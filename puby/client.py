@@ -30,19 +30,17 @@ class PublicationClient:
             ValueError: If authentication fails or API key is invalid
             Exception: For other errors during fetching
         """
+        source_name = type(source).__name__
         try:
-            self.logger.debug(f"Fetching publications from {source.__class__.__name__}")
+            # %-style arguments are only formatted if the record is emitted
+            self.logger.debug("Fetching publications from %s", source_name)
             publications = source.fetch()
             self.logger.info(
-                f"Fetched {len(publications)} publications from {source.__class__.__name__}"
+                "Fetched %d publications from %s", len(publications), source_name
             )
             return publications
-        except ValueError as e:
-            # Re-raise ValueError (which includes authentication errors)
-            # so they can be handled properly by the CLI
-            self.logger.error(f"Error fetching publications: {e}")
-            raise
         except Exception as e:
-            # For non-authentication errors, log but still raise to avoid silent failures
-            self.logger.error(f"Unexpected error fetching publications: {e}")
+            # Log and re-raise (including authentication errors raised as
+            # ValueError) so the CLI can report them; never fail silently
+            self.logger.error("Error fetching publications from %s: %s", source_name, e)
             raise
@@ -1,13 +1,15 @@
 """Check command implementation for comparing publications across sources."""
 
 import sys
-from typing import List, Optional
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import AbstractSet, List, Optional, Set, Tuple
 
 import click
 
 from ..client import PublicationClient
 from ..constants import ZOTERO_API_KEY_URL
 from ..env import get_api_key
+from ..http_session import disable_http_cache
 from ..matcher import PublicationMatcher
 from ..models import Publication, ZoteroConfig
 from ..reporter import ConsoleReporter
@@ -18,7 +20,34 @@ from ..sources import (
     ScholarSource,
     ZoteroSource,
 )
-from .utils import validate_file_writable, validate_sources
+from .utils import is_valid_source_url, validate_file_writable, validate_sources
+
+# Help printed after Zotero configuration and authentication errors
+_ZOTERO_API_KEY_STEP = (
+    f"\nTo fix this issue:\n1. Get your Zotero API key from: {ZOTERO_API_KEY_URL}"
+)
+_ZOTERO_USER_HELP = (
+    f"{_ZOTERO_API_KEY_STEP}\n"
+    "2. For user libraries, you can omit --zotero and let the system "
+    "auto-discover your user ID\n"
+    "   OR provide your user ID with --zotero YOUR_USER_ID"
+)
+_ZOTERO_GROUP_HELP = (
+    f"{_ZOTERO_API_KEY_STEP}\n"
+    "2. For group libraries, provide the group ID with --zotero GROUP_ID"
+)
+_ZOTERO_MY_PUBLICATIONS_USER_NOTE = (
+    "\n3. My Publications endpoint is only available for user libraries"
+)
+_ZOTERO_MY_PUBLICATIONS_GROUP_NOTE = (
+    "\n3. My Publications endpoint is not available for group libraries"
+)
+_ZOTERO_AUTH_HELP = (
+    f"{_ZOTERO_API_KEY_STEP}\n2. Run the command again with --api-key YOUR_KEY"
+)
+
+# Analyses run by _analyze_publications unless a subset is requested
+_ALL_ANALYSES = frozenset(("missing", "duplicates", "potential_matches"))
 
 
 def _initialize_sources(
@@ -28,7 +57,7 @@ def _initialize_sources(
     sources: List[PublicationSource] = []
 
     if scholar:
-        if "scholar.google.com" not in scholar.lower():
+        if not is_valid_source_url("scholar", scholar):
             click.echo(f"Error: Invalid Scholar URL: {scholar}", err=True)
             sys.exit(1)
         try:
@@ -38,7 +67,7 @@ def _initialize_sources(
             sys.exit(1)
 
     if orcid:
-        if "orcid.org" not in orcid.lower():
+        if not is_valid_source_url("orcid", orcid):
             click.echo(f"Error: Invalid ORCID URL: {orcid}", err=True)
             sys.exit(1)
         try:
@@ -48,7 +77,7 @@ def _initialize_sources(
             sys.exit(1)
 
     if pure:
-        if not pure.lower().startswith("https://"):
+        if not is_valid_source_url("pure", pure):
             click.echo(f"Error: Pure URL must use HTTPS: {pure}", err=True)
             sys.exit(1)
         try:
@@ -81,79 +110,100 @@ def _initialize_zotero_source(
         return ZoteroSource(config)
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
-        click.echo("\nTo fix this issue:", err=True)
-        click.echo(
-            f"1. Get your Zotero API key from: {ZOTERO_API_KEY_URL}",
-            err=True,
-        )
         if library_type == "user":
-            click.echo(
-                "2. For user libraries, you can omit --zotero and let the system auto-discover your user ID",
-                err=True,
-            )
-            click.echo(
-                "   OR provide your user ID with --zotero YOUR_USER_ID", err=True
-            )
+            help_text = _ZOTERO_USER_HELP
             if use_my_publications:
-                click.echo(
-                    "3. My Publications endpoint is only available for user libraries",
-                    err=True,
-                )
+                help_text += _ZOTERO_MY_PUBLICATIONS_USER_NOTE
         else:
-            click.echo(
-                "2. For group libraries, provide the group ID with --zotero GROUP_ID",
-                err=True,
-            )
+            help_text = _ZOTERO_GROUP_HELP
             if use_my_publications:
-                click.echo(
-                    "3. My Publications endpoint is not available for group libraries",
-                    err=True,
-                )
+                help_text += _ZOTERO_MY_PUBLICATIONS_GROUP_NOTE
+        click.echo(help_text, err=True)
         sys.exit(1)
 
 
-def _fetch_source_publications(
-    client: PublicationClient, sources: List[PublicationSource], verbose: bool
-) -> List[Publication]:
-    """Fetch publications from all configured sources."""
+def _fetch_all_publications(
+    client: PublicationClient,
+    sources: List[PublicationSource],
+    zotero_source: ZoteroSource,
+    verbose: bool,
+) -> Tuple[List[Publication], List[Publication]]:
+    """Fetch publications from all configured sources and the Zotero library.
+
+    Everything is fetched concurrently since each fetch is dominated by
+    network latency (and rate-limit delays); source results keep the order
+    of ``sources``. A Zotero error is printed as soon as the Zotero fetch
+    fails rather than after the sources finish, but source requests already
+    in flight are not interrupted and the process still waits for them
+    before it exits. All progress and error output is written from the
+    calling thread, so lines never interleave.
+
+    Returns:
+        Publications from the sources and publications from Zotero
+    """
     click.echo("Fetching publications from sources...")
+    if verbose:
+        library_type = zotero_source.config.library_type
+        library_id = zotero_source.config.group_id or "auto-discovered"
+        click.echo(
+            "\n".join(
+                [
+                    *(
+                        f"  Fetching from {source.__class__.__name__}..."
+                        for source in sources
+                    ),
+                    f"  Fetching from Zotero {library_type} library ({library_id})...",
+                ]
+            )
+        )
 
-    all_publications = []
-    for source in sources:
-        if verbose:
-            click.echo(f"  Fetching from {source.__class__.__name__}...")
-        pubs = client.fetch_publications(source)
-        all_publications.extend(pubs)
-        if verbose:
-            click.echo(f"    Found {len(pubs)} publications")
+    executor = ThreadPoolExecutor(max_workers=len(sources) + 1)
+    source_futures: List[Future[List[Publication]]] = []
+    try:
+        zotero_future = executor.submit(client.fetch_publications, zotero_source)
+        source_futures.extend(
+            executor.submit(client.fetch_publications, source) for source in sources
+        )
+        wait([zotero_future, *source_futures], return_when=FIRST_EXCEPTION)
+        zotero_pubs = _zotero_fetch_result(zotero_future)
+        results = [future.result() for future in source_futures]
+    finally:
+        # After a Zotero error, drop fetches that have not started yet
+        # (shutdown's cancel_futures needs Python 3.9). Running fetches
+        # cannot be interrupted; interpreter exit still joins their threads.
+        for future in source_futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    if verbose:
+        click.echo(
+            "\n".join(
+                [
+                    *(
+                        f"    Found {len(pubs)} publications from "
+                        f"{source.__class__.__name__}"
+                        for source, pubs in zip(sources, results)
+                    ),
+                    f"    Found {len(zotero_pubs)} publications from Zotero",
+                ]
+            )
+        )
 
-    return all_publications
+    return [pub for pubs in results for pub in pubs], zotero_pubs
 
 
-def _fetch_zotero_publications(
-    client: PublicationClient, zotero_source: ZoteroSource, verbose: bool
+def _zotero_fetch_result(
+    zotero_future: "Future[List[Publication]]",
 ) -> List[Publication]:
-    """Fetch publications from Zotero library using ZoteroSource."""
-    if verbose:
-        library_type = zotero_source.config.library_type
-        library_id = zotero_source.config.group_id or "auto-discovered"
-        click.echo(f"  Fetching from Zotero {library_type} library ({library_id})...")
+    """Return the Zotero publications, exiting with help on authentication errors."""
     try:
-        zotero_pubs = client.fetch_publications(zotero_source)
-        if verbose:
-            click.echo(f"    Found {len(zotero_pubs)} publications")
-        return zotero_pubs
+        return zotero_future.result()
     except ValueError as e:
         # Propagate authentication errors with clear messages
         error_msg = str(e)
         if "authentication" in error_msg.lower() or "api key" in error_msg.lower():
             click.echo(f"Error: {e}", err=True)
-            click.echo("\nTo fix this issue:", err=True)
-            click.echo(
-                f"1. Get your Zotero API key from: {ZOTERO_API_KEY_URL}",
-                err=True,
-            )
-            click.echo("2. Run the command again with --api-key YOUR_KEY", err=True)
+            click.echo(_ZOTERO_AUTH_HELP, err=True)
             sys.exit(1)
         raise
 
@@ -177,25 +227,18 @@ def _export_missing_publications(
                 f.write("% No missing publications found\n")
                 return
 
-            # Collect all citation keys to resolve conflicts
-            existing_keys = []
-            resolved_publications = []
+            # Resolve citation key conflicts against the keys written so far
+            existing_keys: Set[str] = set()
+            entries = []
 
             for pub in missing_publications:
                 resolved_key = pub.resolve_key_conflicts(existing_keys)
-                existing_keys.append(resolved_key)
-                resolved_publications.append((pub, resolved_key))
-
-            # Write BibTeX entries with resolved keys
-            for pub, resolved_key in resolved_publications:
-                bibtex_entry = pub.to_bibtex()
-                # Replace the original key with resolved key
-                original_key = pub.generate_citation_key()
-                bibtex_entry = bibtex_entry.replace(
-                    f"@article{{{original_key},", f"@article{{{resolved_key},", 1
-                )
-                f.write(bibtex_entry)
-                f.write("\n\n")
+                existing_keys.add(resolved_key)
+                entries.append(pub.to_bibtex(resolved_key))
+
+            # Write all entries at once rather than two writes per entry
+            f.write("\n\n".join(entries))
+            f.write("\n\n")
 
     except PermissionError as e:
         raise PermissionError(f"Permission denied writing to {filename}") from e
@@ -204,15 +247,33 @@ def _export_missing_publications(
 
 
 def _analyze_publications(
-    all_publications: List[Publication], zotero_pubs: List[Publication]
+    all_publications: List[Publication],
+    zotero_pubs: List[Publication],
+    needs: AbstractSet[str] = _ALL_ANALYSES,
 ) -> dict:
-    """Analyze publications for missing, duplicates and potential matches."""
+    """Analyze publications for missing, duplicates and potential matches.
+
+    Args:
+        all_publications: Publications fetched from the sources
+        zotero_pubs: Publications in the Zotero library
+        needs: Analyses to run; skipped ones are reported as empty lists.
+            Duplicate and potential-match detection are the expensive
+            passes, so ``{"missing"}`` is enough for a plain export.
+    """
     click.echo("\nAnalyzing publications...")
     matcher = PublicationMatcher()
 
-    missing = matcher.find_missing(all_publications, zotero_pubs)
-    duplicates = matcher.find_duplicates(zotero_pubs)
-    potential_matches = matcher.find_potential_matches(all_publications, zotero_pubs)
+    missing = (
+        matcher.find_missing(all_publications, zotero_pubs)
+        if "missing" in needs
+        else []
+    )
+    duplicates = matcher.find_duplicates(zotero_pubs) if "duplicates" in needs else []
+    potential_matches = (
+        matcher.find_potential_matches(all_publications, zotero_pubs)
+        if "potential_matches" in needs
+        else []
+    )
 
     return {
         "missing": missing,
@@ -313,6 +374,11 @@ def _print_summary(analysis_results: dict) -> None:
     is_flag=True,
     help="Enable verbose output",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the on-disk HTTP response cache (requires puby[cache])",
+)
 @click.option(
     "--export-missing",
     help="Export missing publications to BibTeX file",
@@ -321,6 +387,11 @@ def _print_summary(analysis_results: dict) -> None:
     default=None,
     required=False,
 )
+@click.option(
+    "--only-export",
+    is_flag=True,
+    help="Only export missing publications; skip duplicate and match reports",
+)
 def check(
     scholar: Optional[str],
     orcid: Optional[str],
@@ -332,7 +403,9 @@ def check(
     zotero_format: str,
     format: str,
     verbose: bool,
+    no_cache: bool,
     export_missing: Optional[str],
+    only_export: bool,
 ) -> None:
     """Compare publications across sources and identify missing or duplicate entries."""
     validate_sources(scholar, orcid, pure)
@@ -350,6 +423,10 @@ def check(
         )
         sys.exit(1)
 
+    if only_export and export_missing is None:
+        click.echo("Error: --only-export requires --export-missing.", err=True)
+        sys.exit(1)
+
     # Validate export file writeability before making any API calls
     if export_missing is not None:
         validate_file_writable(export_missing)
@@ -357,6 +434,9 @@ def check(
     # Get API key with proper precedence (CLI > env > .env)
     resolved_api_key = get_api_key(api_key)
 
+    if no_cache:
+        disable_http_cache()
+
     client = PublicationClient(verbose=verbose)
     sources = _initialize_sources(scholar, orcid, pure)
     zotero_source = _initialize_zotero_source(
@@ -367,10 +447,12 @@ def check(
         zotero_format,
     )
 
-    all_publications = _fetch_source_publications(client, sources, verbose)
-    zotero_pubs = _fetch_zotero_publications(client, zotero_source, verbose)
+    all_publications, zotero_pubs = _fetch_all_publications(
+        client, sources, zotero_source, verbose
+    )
 
-    analysis_results = _analyze_publications(all_publications, zotero_pubs)
+    needs = {"missing"} if only_export else _ALL_ANALYSES
+    analysis_results = _analyze_publications(all_publications, zotero_pubs, needs)
 
     # Export missing publications if requested
     if export_missing is not None:
@@ -384,4 +466,5 @@ def check(
             click.echo(f"Error exporting missing publications: {e}", err=True)
             sys.exit(1)
 
-    _report_results(analysis_results, format)
\ No newline at end of file
+    if not only_export:
+        _report_results(analysis_results, format)
\ No newline at end of file
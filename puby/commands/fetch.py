@@ -6,8 +6,9 @@ from typing import Optional
 import click
 
 from ..client import PublicationClient
-from ..sources import ORCIDSource
-from .utils import validate_file_writable
+from ..http_session import disable_http_cache
+from ..orcid_source import ORCIDSource  # not puby.sources, which loads pyzotero
+from .utils import is_valid_source_url, validate_file_writable
 
 
 @click.command()
@@ -22,7 +23,12 @@ from .utils import validate_file_writable
     type=str,
     default="publications.bib",
 )
-def fetch(orcid: Optional[str], output: str) -> None:
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the on-disk HTTP response cache (requires puby[cache])",
+)
+def fetch(orcid: Optional[str], output: str, no_cache: bool) -> None:
     """Fetch publications from ORCID and save to BibTeX file."""
 
     if not orcid:
@@ -32,24 +38,20 @@ def fetch(orcid: Optional[str], output: str) -> None:
     # Validate output file writeability before making any API calls
     validate_file_writable(output)
 
+    if no_cache:
+        disable_http_cache()
+
     client = PublicationClient()
     
     # URL validation consistent with check command
-    if "orcid.org" not in orcid.lower():
+    if not is_valid_source_url("orcid", orcid):
         click.echo(f"Error: Invalid ORCID URL: {orcid}", err=True)
         sys.exit(1)
     
-    # Initialize source with error handling consistent with check command
+    # Initialize source and fetch with error handling consistent with check
     try:
         source = ORCIDSource(orcid)
-    except ValueError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-
-    click.echo(f"Fetching publications from ORCID: {orcid}")
-    
-    # Fetch publications with consistent error handling
-    try:
+        click.echo(f"Fetching publications from ORCID: {orcid}")
         publications = client.fetch_publications(source)
     except ValueError as e:
         # Handle authentication and validation errors with clean messages
@@ -65,8 +67,9 @@ def fetch(orcid: Optional[str], output: str) -> None:
     # Save to BibTeX file
     try:
         with open(output, "w", encoding="utf-8") as f:
-            for pub in publications:
-                f.write(pub.to_bibtex())
+            if publications:
+                # Write all entries at once rather than two writes per entry
+                f.write("\n\n".join(pub.to_bibtex() for pub in publications))
                 f.write("\n\n")
         click.echo(f"Successfully saved {len(publications)} publications to {output}")
     except Exception as e:
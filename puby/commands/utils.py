@@ -1,12 +1,48 @@
 """Utility functions for CLI commands."""
 
 import os
+import re
+import stat
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
 
+# Host-anchored checks for source URLs given on the command line. Anchoring
+# rejects look-alikes such as "https://scholar.google.com.evil.example/".
+# ORCID iD syntax is left to ORCIDSource, which reports malformed iDs.
+_SOURCE_URL_PATTERNS = {
+    "scholar": re.compile(
+        r"^(?:https?://)?scholar\.google\.com(?:[/?#]|$)", re.IGNORECASE
+    ),
+    "orcid": re.compile(
+        r"^(?:https?://)?(?:www\.)?orcid\.org(?:[/?#]|$)", re.IGNORECASE
+    ),
+    "pure": re.compile(r"^https://[^/\s]+", re.IGNORECASE),
+}
+
+
+def is_valid_source_url(kind: str, url: str) -> bool:
+    """Check a source URL against the pattern for its kind.
+
+    Args:
+        kind: Source kind ("scholar", "orcid" or "pure")
+        url: URL given on the command line
+
+    Returns:
+        True if the URL points at the expected host
+    """
+    return _SOURCE_URL_PATTERNS[kind].match(url.strip()) is not None
+
+
+def _stat_mode(path: Path) -> Optional[int]:
+    """Return the st_mode of path, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
 
 def validate_file_writable(filepath: str) -> None:
     """Validate that a file path can be written to.
@@ -20,16 +56,17 @@ def validate_file_writable(filepath: str) -> None:
     try:
         # Convert to Path object for better path handling
         path = Path(filepath)
-        
-        # Check if parent directory exists and is writable
+
+        # Stat each path once; the mode answers both existence and type
         parent_dir = path.parent
-        if not parent_dir.exists():
+        parent_mode = _stat_mode(parent_dir)
+        if parent_mode is None:
             click.echo(
                 f"Error: Directory does not exist: {parent_dir}", err=True
             )
             sys.exit(1)
         
-        if not parent_dir.is_dir():
+        if not stat.S_ISDIR(parent_mode):
             click.echo(
                 f"Error: Parent path is not a directory: {parent_dir}", err=True
             )
@@ -43,8 +80,9 @@ def validate_file_writable(filepath: str) -> None:
             sys.exit(1)
         
         # If file exists, check if it can be overwritten
-        if path.exists():
-            if not path.is_file():
+        file_mode = _stat_mode(path)
+        if file_mode is not None:
+            if not stat.S_ISREG(file_mode):
                 click.echo(
                     f"Error: Path exists but is not a file: {filepath}", err=True
                 )
@@ -3,6 +3,13 @@
 # Zotero API constants
 ZOTERO_API_KEY_URL = "https://www.zotero.org/settings/keys"
 
+# Parallel page requests allowed against the Zotero API (rate limiting)
+ZOTERO_MAX_CONCURRENT_REQUESTS = 5
+
+# Parallel work detail requests against the ORCID public API, which allows
+# bursts of 40 requests at 24 requests per second
+ORCID_MAX_CONCURRENT_REQUESTS = 8
+
 # Common error messages
 ZOTERO_API_KEY_REQUIRED_ERROR = (
     f"API key is required for Zotero access. "
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 try:
     from dotenv import dotenv_values, load_dotenv
@@ -11,6 +11,35 @@ except ImportError:
     dotenv_values = None
     load_dotenv = None
 
+# Parsed .env files by path, reused while the file's stat signature matches
+_env_file_cache: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Optional[str]]]] = {}
+
+
+def _read_env_file(path: Path) -> Dict[str, Optional[str]]:
+    """Parse a .env file, reusing the previous result if it is unchanged.
+
+    The file is stat'ed once per call; it is only re-parsed when its
+    modification time, size or inode differ from the cached parse.
+
+    Returns:
+        Variables defined in the file, or an empty dict if it does not exist.
+        The result is shared with the cache and must not be modified.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        _env_file_cache.pop(path, None)
+        return {}
+
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _env_file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    values = dict(dotenv_values(path))
+    _env_file_cache[path] = (signature, values)
+    return values
+
 
 def load_api_keys() -> Dict[str, str]:
     """Load API keys from .env files and environment variables.
@@ -30,18 +59,10 @@ def load_api_keys() -> Dict[str, str]:
         return dict(os.environ)
 
     # Load from home directory .env first (lowest precedence)
-    home_env = Path.home() / ".env"
-    if home_env.exists():
-        home_vars = dotenv_values(home_env)
-        if home_vars:
-            env_vars.update(home_vars)
+    env_vars.update(_read_env_file(Path.home() / ".env"))
 
     # Load from current directory .env (higher precedence)
-    current_env = Path.cwd() / ".env"
-    if current_env.exists():
-        current_vars = dotenv_values(current_env)
-        if current_vars:
-            env_vars.update(current_vars)
+    env_vars.update(_read_env_file(Path.cwd() / ".env"))
 
     # Load from actual environment (highest precedence)
     # This preserves any already-set environment variables
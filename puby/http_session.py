@@ -6,12 +6,57 @@ improves performance when making multiple requests to the same domains.
 """
 
 import logging
+import os
 import threading
-from typing import Dict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
 from urllib.parse import urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from urllib3.response import BaseHTTPResponse  # urllib3 2.x only
+
+try:
+    import requests_cache
+except ImportError:
+    # On-disk response caching is optional (pip install "puby[cache]")
+    requests_cache = None
+
+
+# Longest Retry-After delay honoured before retrying; servers such as Google
+# Scholar may ask for minutes or hours, which would stall the whole run
+_MAX_RETRY_AFTER = 10.0
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honours Retry-After only up to _MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response: "BaseHTTPResponse") -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+def _default_cache_path() -> Path:
+    """Return the SQLite file used for cached HTTP responses."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_root) / "puby" / "http_cache.sqlite"
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    """Return whether a response may be stored in the on-disk cache.
+
+    Only responses carrying a validator (ETag or Last-Modified) are stored,
+    so every cache hit can be revalidated with a conditional request.
+    Authenticated Zotero responses are never written to disk.
+    """
+    if "Zotero-API-Key" in response.request.headers:
+        return False
+    return "ETag" in response.headers or "Last-Modified" in response.headers
 
 
 class HTTPSessionManager:
@@ -39,6 +84,7 @@ class HTTPSessionManager:
             self.logger = logging.getLogger(__name__)
             self._sessions: Dict[str, requests.Session] = {}
             self._session_lock = threading.Lock()
+            self.cache_enabled = requests_cache is not None
             self._initialized = True
             self.logger.debug("HTTPSessionManager initialized")
     
@@ -53,11 +99,19 @@ class HTTPSessionManager:
         """
         # Extract clean domain from URL if provided
         clean_domain = self._extract_domain(domain)
-        
+
+        # Double-checked lookup: existing sessions are returned without
+        # taking the lock, which is only needed to create a new one
+        session = self._sessions.get(clean_domain)
+        if session is not None:
+            return session
+
         with self._session_lock:
             if clean_domain not in self._sessions:
                 self._sessions[clean_domain] = self._create_session(clean_domain)
-                self.logger.debug(f"Created new HTTP session for domain: {clean_domain}")
+                self.logger.debug(
+                    "Created new HTTP session for domain: %s", clean_domain
+                )
             
             return self._sessions[clean_domain]
     
@@ -84,7 +138,38 @@ class HTTPSessionManager:
         Returns:
             Configured requests.Session with optimized connection pooling
         """
-        session = requests.Session()
+        session: requests.Session
+        if self.cache_enabled:
+            # Revalidate every cached response (ETag / Last-Modified) so data
+            # is never stale, while unchanged pages come back as cheap 304s
+            session = requests_cache.CachedSession(
+                cache_name=str(_default_cache_path()),
+                backend="sqlite",
+                cache_control=True,
+                always_revalidate=True,
+                allowable_methods=("GET",),
+                match_headers=["Accept"],
+                filter_fn=_is_cacheable,
+            )
+        else:
+            session = requests.Session()
+        
+        # Retry idempotent requests on dropped connections and on rate-limit
+        # or server errors, backing off exponentially and honouring
+        # Retry-After up to _MAX_RETRY_AFTER seconds. Failed connects (e.g.
+        # offline, DNS) are retried once without delay. After the last retry
+        # the final response is returned so sources can still inspect its
+        # status code. Cache revalidation answers (304) are not errors and
+        # never retried.
+        retry = _CappedRetry(
+            total=3,
+            connect=1,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(("GET", "HEAD")),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
         
         # Configure HTTP adapter with connection pooling
         # pool_connections: Number of connection pools to cache (per host)
@@ -92,7 +177,7 @@ class HTTPSessionManager:
         adapter = HTTPAdapter(
             pool_connections=10,  # Cache pools for 10 different hosts
             pool_maxsize=20,      # Keep up to 20 connections per host
-            max_retries=3,        # Retry failed requests up to 3 times
+            max_retries=retry,
             pool_block=False      # Don't block when pool is full
         )
         
@@ -107,6 +192,15 @@ class HTTPSessionManager:
         
         return session
     
+    def disable_cache(self) -> None:
+        """Stop using the on-disk response cache for new sessions.
+        
+        Existing sessions are closed so subsequent requests go straight to
+        the network.
+        """
+        self.cache_enabled = False
+        self.cleanup()
+    
     def cleanup(self) -> None:
         """Close all sessions and clean up resources.
         
@@ -117,9 +211,9 @@ class HTTPSessionManager:
             for domain, session in self._sessions.items():
                 try:
                     session.close()
-                    self.logger.debug(f"Closed session for domain: {domain}")
+                    self.logger.debug("Closed session for domain: %s", domain)
                 except Exception as e:
-                    self.logger.warning(f"Error closing session for {domain}: {e}")
+                    self.logger.warning("Error closing session for %s: %s", domain, e)
             
             self._sessions.clear()
             self.logger.info("All HTTP sessions cleaned up")
@@ -164,4 +258,9 @@ def cleanup_sessions() -> None:
     This function closes all shared sessions and clears the session cache.
     Useful for cleanup during application shutdown or testing.
     """
-    _session_manager.cleanup()
\ No newline at end of file
+    _session_manager.cleanup()
+
+
+def disable_http_cache() -> None:
+    """Disable the optional on-disk HTTP response cache for this process."""
+    _session_manager.disable_cache()
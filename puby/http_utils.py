@@ -16,21 +16,26 @@ USER_AGENTS = [
 ]
 
 
+# Built once at import; the header functions hand out copies of it
+_DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": USER_AGENTS[0] if USER_AGENTS else "puby/1.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+
 def get_default_headers() -> Dict[str, str]:
     """Get default HTTP headers with consistent User-Agent.
     
     Returns:
         Dictionary of HTTP headers with a consistent User-Agent string.
-        Suitable for sources that don't need User-Agent rotation.
+        Suitable for sources that don't need User-Agent rotation. Each
+        call returns a new copy, so callers may modify it.
     """
-    return {
-        "User-Agent": USER_AGENTS[0] if USER_AGENTS else "puby/1.0",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+    return _DEFAULT_HEADERS.copy()
 
 
 def get_headers_with_random_user_agent() -> Dict[str, str]:
@@ -40,7 +45,7 @@ def get_headers_with_random_user_agent() -> Dict[str, str]:
         Dictionary of HTTP headers with a randomly selected User-Agent string.
         Suitable for sources that benefit from User-Agent rotation (e.g., Scholar).
     """
-    headers = get_default_headers()
+    headers = _DEFAULT_HEADERS.copy()
     
     if USER_AGENTS:
         headers["User-Agent"] = random.choice(USER_AGENTS)
@@ -0,0 +1,72 @@
+"""JSON decoding and encoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so both paths accept and produce the same data.
+"""
+
+import json
+import re
+from typing import Any
+
+import requests
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    # Faster JSON handling is optional (pip install "puby[json]")
+    HAS_ORJSON = False
+
+# Characters json.dumps escapes by default (ensure_ascii) but orjson does not
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    """Return a non-ASCII character as json.dumps writes it, e.g. \\u00fc."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        # Outside the BMP json.dumps writes a UTF-16 surrogate pair
+        code -= 0x10000
+        high, low = 0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF)
+        return f"\\u{high:04x}\\u{low:04x}"
+    return f"\\u{code:04x}"
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """Decode the JSON body of an HTTP response.
+
+    The raw bytes are decoded directly instead of going through
+    ``response.text``, which skips building an intermediate string for
+    large Zotero and ORCID payloads.
+
+    Args:
+        response: Response whose body contains JSON
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON,
+            matching the error raised by ``response.json()``
+    """
+    try:
+        if HAS_ORJSON:
+            return orjson.loads(response.content)
+        return json.loads(response.content)
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def dumps_indented(data: Any) -> str:
+    """Serialize data as JSON indented by two spaces.
+
+    The output equals ``json.dumps(data, indent=2)`` on both code paths, so
+    non-ASCII characters are escaped even though orjson writes UTF-8.
+    """
+    if HAS_ORJSON:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        if text.isascii():
+            return text
+        return _NON_ASCII_RE.sub(_escape_non_ascii, text)
+    return json.dumps(data, indent=2)
@@ -1,16 +1,176 @@
 """Publication matching and comparison utilities."""
 
+import os
 import re
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from .models import Author, Publication
+from .models import _SLOTS, Author, Publication
 from .similarity_utils import (
     calculate_author_set_similarity,
+    calculate_jaccard_similarity,
     calculate_title_similarity_with_length_penalty,
     normalize_text,
+    normalized_word_set,
 )
 
+# Title similarity needed before the title counts towards confidence
+_MIN_TITLE_SIMILARITY = 0.6
+
+# Highest confidence reachable without a title score (year, authors, journal)
+_MAX_NON_TITLE_CONFIDENCE = 0.5
+
+# Source x reference pairs above which potential matching uses worker processes.
+# Pool startup and shipping the features cost far more than serial scoring of
+# ten thousand pairs, so only very large comparisons are worth splitting.
+_PARALLEL_MIN_PAIRS = 1_000_000
+
+# Chunks per worker process, so uneven chunks still balance across workers
+_CHUNKS_PER_WORKER = 4
+
+# Matcher and features handed to each worker process once, not per chunk
+_worker_state: Dict[str, Any] = {}
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def _init_potential_match_worker(
+    thresholds: Tuple[float, int, float],
+    source_features: List["_PublicationFeatures"],
+    reference_features: List["_PublicationFeatures"],
+) -> None:
+    """Store the precomputed matching inputs in a worker process."""
+    similarity_threshold, year_tolerance, potential_threshold = thresholds
+    _worker_state["matcher"] = PublicationMatcher(
+        similarity_threshold, year_tolerance, potential_threshold
+    )
+    _worker_state["source_features"] = source_features
+    _worker_state["reference_features"] = reference_features
+
+
+def _score_potential_match_chunk(
+    start: int, stop: int
+) -> List[Tuple[int, int, float]]:
+    """Score source publications start..stop in a worker process."""
+    matcher: PublicationMatcher = _worker_state["matcher"]
+    return matcher._score_potential_matches(
+        _worker_state["source_features"],
+        _worker_state["reference_features"],
+        start,
+        stop,
+    )
+
+
+def _find_root(parent: List[int], i: int) -> int:
+    """Return the root of i in a union-find forest, halving the path."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _title_words(title: Optional[str]) -> FrozenSet[str]:
+    """Return the normalized word set used for title similarity."""
+    return normalized_word_set(title) if title else frozenset()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_author_name(author: Author) -> str:
+    """Normalize author name for comparison as "FAMILY, I"."""
+    if author.family_name and author.given_name:
+        # Use first initial of given name
+        given_initial = author.given_name[0].upper() if author.given_name else ""
+        return f"{author.family_name.upper()}, {given_initial}"
+    else:
+        # Fallback to full name, extract family name and initial
+        name_parts = author.name.split()
+        if len(name_parts) >= 2:
+            # Assume last part is family name
+            family = name_parts[-1].upper()
+            given_initial = name_parts[0][0].upper() if name_parts[0] else ""
+            return f"{family}, {given_initial}"
+        else:
+            return author.name.upper()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_author_names(authors: Tuple[Author, ...]) -> FrozenSet[str]:
+    """Return the normalized names of an author list."""
+    return frozenset(_normalize_author_name(author) for author in authors)
+
+
+@dataclass(**_SLOTS)
+class _PublicationFeatures:
+    """Normalized fields of a publication, computed once per comparison run.
+
+    Fields are None where the publication has no value, mirroring the
+    truthiness checks in PublicationMatcher._calculate_similarity.
+    """
+
+    doi: Optional[str]
+    title: Optional[str]
+    title_words: FrozenSet[str]
+    year: Optional[int]
+    author_names: Optional[FrozenSet[str]]
+    journal: Optional[str]
+
+
+class _CandidateIndex:
+    """Index of publications for looking up possible matches.
+
+    Without a title score a pair cannot exceed _MAX_NON_TITLE_CONFIDENCE,
+    and the title only scores above _MIN_TITLE_SIMILARITY when the titles
+    share more than that fraction of the longer title's words. Pairs with
+    equal DOIs match regardless of title and are looked up separately.
+    """
+
+    def __init__(self, features: Sequence[_PublicationFeatures]):
+        """Index publications by DOI and title words."""
+        self._by_doi: Dict[str, List[int]] = defaultdict(list)
+        self._by_word: Dict[str, List[int]] = defaultdict(list)
+        self._word_counts: List[int] = []
+
+        for i, pub in enumerate(features):
+            if pub.doi is not None:
+                self._by_doi[pub.doi].append(i)
+            self._word_counts.append(len(pub.title_words))
+            for word in pub.title_words:
+                self._by_word[word].append(i)
+
+    def candidates(self, pub: _PublicationFeatures) -> Optional[List[int]]:
+        """Return indices of publications that may match pub, in order.
+
+        Returns None if pub cannot be narrowed down (a title consisting
+        only of punctuation), in which case every publication is a candidate.
+        """
+        words = pub.title_words
+        if pub.title is not None and not words:
+            return None
+
+        shared: Counter = Counter()
+        for word in words:
+            shared.update(self._by_word.get(word, ()))
+
+        found = {
+            i
+            for i, n in shared.items()
+            if n >= _MIN_TITLE_SIMILARITY * max(len(words), self._word_counts[i])
+        }
+        if pub.doi is not None:
+            found.update(self._by_doi.get(pub.doi, ()))
+
+        return sorted(found)
+
 
 @dataclass
 class MatchResult:
@@ -112,7 +272,7 @@ class PublicationMatcher:
         # Title similarity (weighted heavily)
         if pub1.title and pub2.title:
             title_sim = self._calculate_title_similarity(pub1.title, pub2.title)
-            if title_sim > 0.6:
+            if title_sim > _MIN_TITLE_SIMILARITY:
                 confidence += title_sim * 0.5
                 reasons.append("title")
 
@@ -151,12 +311,16 @@ class PublicationMatcher:
         if not reference_pubs:
             return list(source_pubs)
 
+        source_features = self._features_of(source_pubs)
+        reference_features = self._features_of(reference_pubs)
+        index = self._build_candidate_index(reference_features)
+
         missing = []
-        for source_pub in source_pubs:
+        for source_pub, source in zip(source_pubs, source_features):
             found = False
-            for ref_pub in reference_pubs:
-                result = self.match_publications(source_pub, ref_pub)
-                if result.is_match:
+            candidates = self._candidate_indices(index, source, len(reference_pubs))
+            for j in candidates:
+                if self._features_match(source, reference_features[j]):
                     found = True
                     break
             if not found:
@@ -167,59 +331,252 @@ class PublicationMatcher:
     def find_duplicates(
         self, publications: List[Publication]
     ) -> List[List[Publication]]:
-        """Find duplicate publications within a list."""
+        """Find duplicate publications within a list.
+
+        Duplicates are grouped transitively: if A matches B and B matches C,
+        all three form one group even when A and C do not match directly.
+        Groups and their members keep the order of the input list.
+        """
         if not publications:
             return []
 
-        duplicates = []
-        seen = set()
+        features = self._features_of(publications)
+        index = self._build_candidate_index(features)
 
-        for i, pub1 in enumerate(publications):
-            if i in seen:
-                continue
+        # Union-find forest over publication indices; roots are the
+        # smallest index of their group
+        parent = list(range(len(publications)))
 
-            group = [pub1]
-            for j, pub2 in enumerate(publications[i + 1 :], start=i + 1):
-                if j not in seen:
-                    result = self.match_publications(pub1, pub2)
-                    if result.is_match:
-                        group.append(pub2)
-                        seen.add(j)
+        for i in range(len(publications)):
+            candidates = self._candidate_indices(index, features[i], len(publications))
+            for j in candidates:
+                if j <= i:
+                    continue
+                root_i = _find_root(parent, i)
+                root_j = _find_root(parent, j)
+                # Pairs already in one group need not be compared
+                if root_i != root_j and self._features_match(features[i], features[j]):
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
 
-            if len(group) > 1:
-                duplicates.append(group)
-                seen.add(i)
+        groups: Dict[int, List[Publication]] = defaultdict(list)
+        for i, pub in enumerate(publications):
+            groups[_find_root(parent, i)].append(pub)
 
-        return duplicates
+        return [group for group in groups.values() if len(group) > 1]
 
     def find_potential_matches(
         self, source_pubs: List[Publication], reference_pubs: List[Publication]
     ) -> List[PotentialMatch]:
-        """Find potential matches between source and reference with scores."""
-        potential_matches = []
+        """Find potential matches between source and reference with scores.
 
-        for source_pub in source_pubs:
-            for ref_pub in reference_pubs:
-                result = self.match_publications(source_pub, ref_pub)
+        Every pair has to be scored, so each publication is normalized once
+        up front rather than once per pair. Large comparisons are split by
+        source publication across worker processes; small ones run
+        in-process to avoid the startup cost.
+        """
+        source_features = self._features_of(source_pubs)
+        reference_features = self._features_of(reference_pubs)
+
+        scored = None
+        workers = _available_cpus()
+        if workers > 1 and len(source_pubs) * len(reference_pubs) > _PARALLEL_MIN_PAIRS:
+            scored = self._score_potential_matches_parallel(
+                source_features, reference_features, workers
+            )
+        if scored is None:
+            scored = self._score_potential_matches(
+                source_features, reference_features, 0, len(source_features)
+            )
+
+        # Sort by confidence score (highest first) before building results
+        scored.sort(key=itemgetter(2), reverse=True)
+
+        return [
+            PotentialMatch(
+                source_publication=source_pubs[i],
+                reference_publication=reference_pubs[j],
+                confidence=confidence,
+            )
+            for i, j, confidence in scored
+        ]
+
+    def _score_potential_matches(
+        self,
+        source_features: Sequence[_PublicationFeatures],
+        reference_features: Sequence[_PublicationFeatures],
+        start: int,
+        stop: int,
+    ) -> List[Tuple[int, int, float]]:
+        """Score source publications start..stop against all references.
+
+        Returns:
+            (source index, reference index, confidence) for each pair that
+            is a potential but not an exact match, in source order
+        """
+        scored = []
+
+        # When both sides have a DOI the DOI alone decides the match
+        # (confidence 1.0 or 0.0), so such pairs are never potential matches
+        skip_doi_pairs = (
+            self.potential_threshold > 0.0 and self.similarity_threshold <= 1.0
+        )
+        all_refs = range(len(reference_features))
+        refs_without_doi = [j for j in all_refs if reference_features[j].doi is None]
+
+        for i in range(start, stop):
+            source = source_features[i]
+            if skip_doi_pairs and source.doi is not None:
+                candidates: Sequence[int] = refs_without_doi
+            else:
+                candidates = all_refs
+            for j in candidates:
+                confidence = self._feature_confidence(source, reference_features[j])
 
                 # If it's a potential match but not exact
-                if (
-                    self.potential_threshold
-                    <= result.confidence
-                    < self.similarity_threshold
-                ):
-                    potential_matches.append(
-                        PotentialMatch(
-                            source_publication=source_pub,
-                            reference_publication=ref_pub,
-                            confidence=result.confidence,
-                        )
+                if self.potential_threshold <= confidence < self.similarity_threshold:
+                    scored.append((i, j, confidence))
+
+        return scored
+
+    def _score_potential_matches_parallel(
+        self,
+        source_features: List[_PublicationFeatures],
+        reference_features: List[_PublicationFeatures],
+        workers: int,
+    ) -> Optional[List[Tuple[int, int, float]]]:
+        """Score potential matches in worker processes.
+
+        Only the precomputed features and thresholds are sent to the
+        workers. Chunks are contiguous source ranges merged in order, so the
+        result equals the serial one. Returns None if the pool fails for any
+        reason, leaving the caller to score in-process.
+        """
+        thresholds = (
+            self.similarity_threshold,
+            self.year_tolerance,
+            self.potential_threshold,
+        )
+        count = len(source_features)
+        size = max(1, -(-count // (workers * _CHUNKS_PER_WORKER)))
+        bounds = [(start, min(start + size, count)) for start in range(0, count, size)]
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(bounds)),
+                initializer=_init_potential_match_worker,
+                initargs=(thresholds, source_features, reference_features),
+            ) as executor:
+                chunks = executor.map(_score_potential_match_chunk, *zip(*bounds))
+                return [row for chunk in chunks for row in chunk]
+        except Exception:  # Process creation, pickling or a broken pool
+            return None
+
+    def _features_of(
+        self, publications: Sequence[Publication]
+    ) -> List[_PublicationFeatures]:
+        """Normalize the fields used for matching of each publication."""
+        return [
+            _PublicationFeatures(
+                doi=self._normalize_doi(pub.doi) if pub.doi else None,
+                title=self._normalize_text(pub.title) if pub.title else None,
+                title_words=_title_words(pub.title),
+                year=pub.year or None,
+                author_names=(
+                    _normalize_author_names(tuple(pub.authors))
+                    if pub.authors
+                    else None
+                ),
+                journal=self._normalize_text(pub.journal) if pub.journal else None,
+            )
+            for pub in publications
+        ]
+
+    def _feature_confidence(
+        self, features1: _PublicationFeatures, features2: _PublicationFeatures
+    ) -> float:
+        """Return the confidence match_publications would report for a pair.
+
+        Same scoring as _check_doi_match and _calculate_similarity, but on
+        pre-normalized fields and without building a MatchResult.
+        """
+        if features1.doi is not None and features2.doi is not None:
+            return 1.0 if features1.doi == features2.doi else 0.0
+
+        confidence = 0.0
+
+        if features1.title is not None and features2.title is not None:
+            if features1.title == features2.title:
+                title_sim = 1.0
+            else:
+                words1 = features1.title_words
+                words2 = features2.title_words
+                title_sim = 0.0
+                if words1 and words2:
+                    # Jaccard similarity with the length penalty of
+                    # calculate_title_similarity_with_length_penalty.
+                    # Jaccard cannot exceed the length ratio, so titles whose
+                    # lengths differ too much are rejected without comparing
+                    len_ratio = min(len(words1), len(words2)) / max(
+                        len(words1), len(words2)
                     )
+                    if len_ratio * len_ratio > _MIN_TITLE_SIMILARITY:
+                        jaccard = calculate_jaccard_similarity(words1, words2)
+                        title_sim = jaccard * len_ratio
+            if title_sim > _MIN_TITLE_SIMILARITY:
+                confidence += title_sim * 0.5
+
+        if features1.year is not None and features2.year is not None:
+            year_diff = abs(features1.year - features2.year)
+            if year_diff <= self.year_tolerance:
+                year_score = max(0, 1.0 - (year_diff / (self.year_tolerance + 1)))
+                confidence += year_score * 0.2
 
-        # Sort by confidence score (highest first)
-        potential_matches.sort(key=lambda x: x.confidence, reverse=True)
+        if features1.author_names is not None and features2.author_names is not None:
+            author_sim = calculate_author_set_similarity(
+                features1.author_names, features2.author_names
+            )
+            if author_sim > 0.3:
+                confidence += author_sim * 0.2
+
+        if features1.journal is not None and features1.journal == features2.journal:
+            confidence += 0.1
 
-        return potential_matches
+        return min(confidence, 1.0)
+
+    def _features_match(
+        self, features1: _PublicationFeatures, features2: _PublicationFeatures
+    ) -> bool:
+        """Return whether match_publications would report a match for a pair.
+
+        Two DOIs decide the pair on their own, before any similarity scoring.
+        """
+        if features1.doi is not None and features2.doi is not None:
+            return features1.doi == features2.doi
+        return self._feature_confidence(features1, features2) >= (
+            self.similarity_threshold
+        )
+
+    def _build_candidate_index(
+        self, features: Sequence[_PublicationFeatures]
+    ) -> Optional[_CandidateIndex]:
+        """Index publications for matching, if the threshold allows pruning.
+
+        A threshold at or below _MAX_NON_TITLE_CONFIDENCE can be reached
+        without any title overlap, so every pair has to be compared.
+        """
+        if self.similarity_threshold <= _MAX_NON_TITLE_CONFIDENCE:
+            return None
+        return _CandidateIndex(features)
+
+    def _candidate_indices(
+        self,
+        index: Optional[_CandidateIndex],
+        pub: _PublicationFeatures,
+        count: int,
+    ) -> Sequence[int]:
+        """Return indices of indexed publications that may match pub."""
+        indices = index.candidates(pub) if index else None
+        return range(count) if indices is None else indices
 
     def _normalize_doi(self, doi: str) -> str:
         """Normalize DOI for comparison."""
@@ -249,25 +606,12 @@ class PublicationMatcher:
         if not authors1 or not authors2:
             return 0.0
 
-        # Get normalized author names
-        names1 = {self._normalize_author_name(author) for author in authors1}
-        names2 = {self._normalize_author_name(author) for author in authors2}
+        # Normalized names are cached per author list (Author is immutable)
+        names1 = _normalize_author_names(tuple(authors1))
+        names2 = _normalize_author_names(tuple(authors2))
 
         return calculate_author_set_similarity(names1, names2)
 
     def _normalize_author_name(self, author: Author) -> str:
         """Normalize author name for comparison."""
-        if author.family_name and author.given_name:
-            # Use first initial of given name
-            given_initial = author.given_name[0].upper() if author.given_name else ""
-            return f"{author.family_name.upper()}, {given_initial}"
-        else:
-            # Fallback to full name, extract family name and initial
-            name_parts = author.name.split()
-            if len(name_parts) >= 2:
-                # Assume last part is family name
-                family = name_parts[-1].upper()
-                given_initial = name_parts[0][0].upper() if name_parts[0] else ""
-                return f"{family}, {given_initial}"
-            else:
-                return author.name.upper()
+        return _normalize_author_name(author)
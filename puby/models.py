@@ -2,10 +2,12 @@
 
 import re
 import string
+import sys
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Collection, Dict, List, Optional
 
 from .constants import (
     ZOTERO_API_KEY_REQUIRED_ERROR,
@@ -16,10 +18,59 @@ from .similarity_utils import (
     calculate_simple_similarity,
 )
 
-
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Identifier formats checked by validation_errors
+_DOI_RE = re.compile(r"^10\.\d+/.+")
+_ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
+
+# Title normalization for Publication.matches, applied in order
+_LATEX_PATTERNS = [
+    (re.compile(r"\\textbf\{([^}]+)\}"), r"\1"),  # \textbf{text} -> text
+    (re.compile(r"\\textit\{([^}]+)\}"), r"\1"),  # \textit{text} -> text
+    (re.compile(r"\\emph\{([^}]+)\}"), r"\1"),  # \emph{text} -> text
+    (re.compile(r"\\text\{([^}]+)\}"), r"\1"),  # \text{text} -> text
+    (re.compile(r"\\[a-zA-Z]+\{([^}]*)\}"), r"\1"),  # Generic \command{text} -> text
+    (re.compile(r"\{([^}]+)\}"), r"\1"),  # {text} -> text
+    (re.compile(r"\\[a-zA-Z]+"), ""),  # Remove remaining LaTeX commands
+]
+_HTML_PATTERNS = [
+    (re.compile(r"&[a-zA-Z]+;"), " "),  # &nbsp; etc.
+    (re.compile(r"<[^>]+>"), " "),  # HTML tags
+]
+_TITLE_PUNCTUATION_RE = re.compile(r"[^\w\s-]")  # Keep letters, digits, spaces, hyphens
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Citation key cleanup: hyphen runs to collapse, and transliterations for
+# letters that do not decompose into an ASCII letter plus accents
+_HYPHEN_RUN_RE = re.compile(r"-+")
+_NON_SURNAME_ASCII_RE = re.compile(r"[^A-Za-z-]")
+_TRANSLITERATIONS = {
+    "ñ": "n",
+    "ç": "c",
+    "ß": "ss",
+    "æ": "ae",
+    "ø": "o",
+    "å": "a",
+    "ł": "l",
+    "ż": "z",
+    "ź": "z",
+    "ś": "s",
+}
+
+# Page range separators for the citation key, in order of precedence
+# (hyphen, en dash, em dash, words)
+_PAGE_SEPARATORS = ("-", "\u2013", "\u2014", " to ", " TO ")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Author:
-    """Represents a publication author."""
+    """Represents a publication author.
+
+    Authors are immutable so parsed instances can be cached and shared
+    between publications.
+    """
 
     name: str
     given_name: Optional[str] = None
@@ -50,7 +101,7 @@ class Author:
         return errors
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Publication:
     """Represents a scientific publication."""
 
@@ -71,7 +122,7 @@ class Publication:
 
     def __str__(self) -> str:
         """Return formatted publication string."""
-        author_str = ", ".join(str(a) for a in self.authors[:3])
+        author_str = ", ".join(map(str, self.authors[:3]))
         if len(self.authors) > 3:
             author_str += " et al."
 
@@ -81,17 +132,23 @@ class Publication:
 
         return f"{author_str}{year_str}. {self.title}.{journal_str}.{doi_str}"
 
-    def to_bibtex(self) -> str:
-        """Convert publication to BibTeX format."""
+    def to_bibtex(self, cite_key: Optional[str] = None) -> str:
+        """Convert publication to BibTeX format.
+
+        Args:
+            cite_key: Citation key to use, e.g. one returned by
+                resolve_key_conflicts(). Defaults to generate_citation_key().
+        """
         # Generate standardized citation key
-        cite_key = self.generate_citation_key()
+        if cite_key is None:
+            cite_key = self.generate_citation_key()
 
         # Build BibTeX entry
         lines = [f"@article{{{cite_key},"]
         lines.append(f'  title = "{{{self.title}}}",')
 
         if self.authors:
-            author_str = " and ".join(str(a) for a in self.authors)
+            author_str = " and ".join(map(str, self.authors))
             lines.append(f'  author = "{{{author_str}}}",')
 
         if self.year:
@@ -144,9 +201,9 @@ class Publication:
         name = name.strip()
 
         # Format: "Lastname, Firstname"
-        if "," in name:
-            parts = name.split(",", 1)
-            return parts[0].strip()
+        surname, sep, _ = name.partition(",")
+        if sep:
+            return surname.strip()
 
         # Format: "Firstname Lastname" or "Firstname Middle Lastname"
         # Take the last word as surname
@@ -158,45 +215,7 @@ class Publication:
 
     def _clean_surname_for_citation(self, surname: str) -> str:
         """Clean surname for citation key (remove accents, special chars)."""
-        if not surname:
-            return "Unknown"
-
-        # Normalize unicode (decompose accents)
-        surname = unicodedata.normalize("NFD", surname)
-
-        # Remove combining characters (accents)
-        surname = "".join(c for c in surname if unicodedata.category(c) != "Mn")
-
-        # Replace non-ASCII letters and keep hyphens
-        cleaned = ""
-        for char in surname:
-            if char.isascii() and (char.isalpha() or char == "-"):
-                cleaned += char
-            elif not char.isascii() and char.isalpha():
-                # Try basic transliteration for common cases
-                cleaned += self._transliterate_char(char)
-
-        # Remove multiple consecutive hyphens and strip
-        cleaned = re.sub(r"-+", "-", cleaned).strip("-")
-
-        return cleaned if cleaned else "Unknown"
-
-    def _transliterate_char(self, char: str) -> str:
-        """Basic transliteration for non-ASCII characters."""
-        # Simple mapping for common cases
-        transliteration_map = {
-            "ñ": "n",
-            "ç": "c",
-            "ß": "ss",
-            "æ": "ae",
-            "ø": "o",
-            "å": "a",
-            "ł": "l",
-            "ż": "z",
-            "ź": "z",
-            "ś": "s",
-        }
-        return transliteration_map.get(char.lower(), char)
+        return _clean_surname_for_citation(surname)
 
     def generate_citation_key(self) -> str:
         """Generate standardized citation key in AuthorYear-Page format."""
@@ -223,7 +242,7 @@ class Publication:
         pages = pages.strip()
 
         # Split on common separators
-        for separator in ["-", "-", "—", " to ", " TO "]:
+        for separator in _PAGE_SEPARATORS:
             if separator in pages:
                 first_part = pages.split(separator)[0].strip()
                 if first_part:
@@ -233,8 +252,12 @@ class Publication:
         # Return the whole string if no separators found
         return pages
 
-    def resolve_key_conflicts(self, existing_keys: List[str]) -> str:
-        """Resolve citation key conflicts by adding letter suffixes."""
+    def resolve_key_conflicts(self, existing_keys: Collection[str]) -> str:
+        """Resolve citation key conflicts by adding letter suffixes.
+
+        Pass a set when resolving many keys; each candidate is checked by
+        membership, which is linear for a list.
+        """
         base_key = self.generate_citation_key()
 
         if base_key not in existing_keys:
@@ -308,43 +331,7 @@ class Publication:
         Returns:
             str: Normalized title for comparison
         """
-        if not title:
-            return ""
-
-        # Convert to lowercase
-        normalized = title.lower()
-
-        # Remove common LaTeX formatting
-        latex_patterns = [
-            (r"\\textbf\{([^}]+)\}", r"\1"),  # \textbf{text} -> text
-            (r"\\textit\{([^}]+)\}", r"\1"),  # \textit{text} -> text
-            (r"\\emph\{([^}]+)\}", r"\1"),  # \emph{text} -> text
-            (r"\\text\{([^}]+)\}", r"\1"),  # \text{text} -> text
-            (r"\\[a-zA-Z]+\{([^}]*)\}", r"\1"),  # Generic \command{text} -> text
-            (r"\{([^}]+)\}", r"\1"),  # {text} -> text
-            (r"\\[a-zA-Z]+", ""),  # Remove remaining LaTeX commands
-        ]
-
-        for pattern, replacement in latex_patterns:
-            normalized = re.sub(pattern, replacement, normalized)
-
-        # Remove HTML entities and tags
-        html_patterns = [
-            (r"&[a-zA-Z]+;", " "),  # &nbsp; etc.
-            (r"<[^>]+>", " "),  # HTML tags
-        ]
-
-        for pattern, replacement in html_patterns:
-            normalized = re.sub(pattern, replacement, normalized)
-
-        # Normalize punctuation and whitespace
-        normalized = re.sub(
-            r"[^\w\s-]", " ", normalized
-        )  # Keep letters, digits, spaces, hyphens
-        normalized = re.sub(r"\s+", " ", normalized)  # Collapse multiple spaces
-        normalized = normalized.strip()
-
-        return normalized
+        return _normalize_title(title)
 
     def _calculate_fuzzy_similarity(self, title1: str, title2: str) -> float:
         """Calculate enhanced fuzzy similarity between two normalized titles.
@@ -390,11 +377,10 @@ class Publication:
     @staticmethod
     def _is_valid_doi(doi: str) -> bool:
         """Validate DOI format."""
-        pattern = r"^10\.\d+/.+"
-        return bool(re.match(pattern, doi))
+        return _DOI_RE.match(doi) is not None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ZoteroConfig:
     """Configuration for Zotero API access."""
 
@@ -452,12 +438,68 @@ class ZoteroConfig:
             return False
 
         # Must contain only ASCII alphanumeric characters (letters and numbers)
-        # Using all() with individual character checks for more precise control
-        return all(c.isascii() and c.isalnum() for c in api_key)
+        return api_key.isascii() and api_key.isalnum()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    """Normalize title for fuzzy matching.
+
+    Cached, since matches() is called pairwise and normalizes each title
+    once per comparison.
+    """
+    if not title:
+        return ""
+
+    # Convert to lowercase
+    normalized = title.lower()
+
+    # Remove common LaTeX formatting, then HTML entities and tags
+    for pattern, replacement in _LATEX_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+    for pattern, replacement in _HTML_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+
+    # Normalize punctuation and whitespace
+    normalized = _TITLE_PUNCTUATION_RE.sub(" ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)  # Collapse multiple spaces
+    normalized = normalized.strip()
+
+    return normalized
+
+
+@lru_cache(maxsize=4096)
+def _clean_surname_for_citation(surname: str) -> str:
+    """Clean surname for citation key (remove accents, special chars).
+
+    Cached, since exporting a library cleans the same surnames repeatedly.
+    """
+    if not surname:
+        return "Unknown"
+
+    if surname.isascii():
+        # Nothing to decompose or transliterate, keep letters and hyphens
+        cleaned = _NON_SURNAME_ASCII_RE.sub("", surname)
+    else:
+        # Normalize unicode (decompose accents). The combining accents are
+        # not letters, so the loop below drops them with other symbols
+        surname = unicodedata.normalize("NFD", surname)
+
+        # Replace non-ASCII letters and keep hyphens
+        cleaned = ""
+        for char in surname:
+            if char.isascii() and (char.isalpha() or char == "-"):
+                cleaned += char
+            elif not char.isascii() and char.isalpha():
+                # Try basic transliteration for common cases
+                cleaned += _TRANSLITERATIONS.get(char.lower(), char)
+
+    # Remove multiple consecutive hyphens and strip
+    cleaned = _HYPHEN_RUN_RE.sub("-", cleaned).strip("-")
 
+    return cleaned if cleaned else "Unknown"
 
 
 def _is_valid_orcid(orcid: str) -> bool:
     """Validate ORCID ID format."""
-    pattern = r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$"
-    return bool(re.match(pattern, orcid))
+    return _ORCID_RE.match(orcid) is not None
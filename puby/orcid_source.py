@@ -2,15 +2,21 @@
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import requests
 
 from .base import PublicationSource
+from .constants import ORCID_MAX_CONCURRENT_REQUESTS
 from .models import Author, Publication
 from .utils import safe_int_from_value
 from .author_utils import create_fallback_author, parse_plain_author_names
 from .http_utils import get_session_for_url
+from .json_utils import parse_json_response
+
+# ORCID iD like 0000-0000-0000-0000 (last digit can be X)
+_ORCID_ID_RE = re.compile(r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]")
 
 
 class ORCIDSource(PublicationSource):
@@ -26,18 +32,18 @@ class ORCIDSource(PublicationSource):
 
     def _extract_orcid_id(self, url: str) -> str:
         """Extract ORCID ID from URL."""
-        # Match pattern like 0000-0000-0000-0000 (last digit can be X)
-        pattern = r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]"
-        match = re.search(pattern, url)
+        # A bare ID is matched whole; otherwise look for the ID inside the URL
+        match = _ORCID_ID_RE.fullmatch(url) or _ORCID_ID_RE.search(url)
         if match:
             return match.group()
-        # If just the ID was provided
-        if re.match(pattern, url):
-            return url
         raise ValueError(f"Invalid ORCID URL or ID: {url}")
 
     def fetch(self) -> List[Publication]:
-        """Fetch publications from ORCID API."""
+        """Fetch publications from ORCID API.
+
+        The works summary lists one put-code per work; the details of the
+        works are then requested concurrently, keeping the summary order.
+        """
         publications = []
 
         # Fetch works summary
@@ -47,31 +53,44 @@ class ORCIDSource(PublicationSource):
         try:
             response = self._session.get(works_url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json_response(response)
 
             # Get work summaries
             work_groups = data.get("group", [])
 
+            put_codes = []
             for group in work_groups:
                 work_summary = group.get("work-summary", [])
                 if work_summary:
                     # Take the first summary (they should be duplicates)
-                    summary = work_summary[0]
-
-                    # Fetch detailed work data
-                    put_code = summary.get("put-code")
+                    put_code = work_summary[0].get("put-code")
                     if put_code:
-                        work_detail = self._fetch_work_detail(put_code)
-                        if work_detail:
-                            pub = self._parse_work(work_detail)
-                            if pub:
-                                publications.append(pub)
+                        put_codes.append(put_code)
+
+            # Fetch detailed work data
+            for work_detail in self._fetch_work_details(put_codes):
+                if work_detail:
+                    pub = self._parse_work(work_detail)
+                    if pub:
+                        publications.append(pub)
 
         except requests.RequestException as e:
             self.logger.error(f"Error fetching ORCID data: {e}")
 
         return publications
 
+    def _fetch_work_details(
+        self, put_codes: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch detailed work information for each put-code in parallel."""
+        if not put_codes:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(put_codes), ORCID_MAX_CONCURRENT_REQUESTS)
+        ) as executor:
+            return list(executor.map(self._fetch_work_detail, put_codes))
+
     def _fetch_work_detail(self, put_code: str) -> Optional[Dict[str, Any]]:
         """Fetch detailed work information."""
         url = f"{self.api_base}/{self.orcid_id}/work/{put_code}"
@@ -80,7 +99,7 @@ class ORCIDSource(PublicationSource):
         try:
             response = self._session.get(url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json_response(response)
             return data if isinstance(data, dict) else None
         except requests.RequestException as e:
             self.logger.error(f"Error fetching work detail: {e}")
@@ -15,6 +15,7 @@ from .models import Author, Publication
 from .utils import extract_year_from_text
 from .author_utils import parse_plain_author_names
 from .http_utils import get_default_headers, get_session_for_url
+from .json_utils import parse_json_response
 
 
 class PureSource(PublicationSource):
@@ -76,7 +77,7 @@ class PureSource(PublicationSource):
             response = self._session.get(api_url, headers=self._get_headers())
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json_response(response)
                 return self._parse_api_response(data)
         except Exception as e:
             self.logger.warning(f"Pure API failed, falling back to HTML scraping: {e}")
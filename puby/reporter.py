@@ -1,7 +1,6 @@
 """Reporting utilities for publication analysis results."""
 
 import csv
-import json
 from dataclasses import dataclass
 from io import StringIO
 from typing import Dict, List, Tuple
@@ -9,6 +8,7 @@ from typing import Dict, List, Tuple
 import click
 from tabulate import tabulate
 
+from .json_utils import dumps_indented
 from .matcher import PotentialMatch
 from .models import Publication
 
@@ -86,7 +86,7 @@ class ConsoleReporter:
             # Format authors
             if pub.authors:
                 if len(pub.authors) <= 2:
-                    authors = ", ".join(str(a) for a in pub.authors)
+                    authors = ", ".join(map(str, pub.authors))
                 else:
                     authors = f"{pub.authors[0]} et al."
             else:
@@ -116,7 +116,7 @@ class ConsoleReporter:
             data.append(
                 {
                     "title": pub.title,
-                    "authors": [str(a) for a in pub.authors],
+                    "authors": list(map(str, pub.authors)),
                     "year": pub.year,
                     "journal": pub.journal,
                     "doi": pub.doi,
@@ -125,7 +125,7 @@ class ConsoleReporter:
                 }
             )
 
-        click.echo(json.dumps(data, indent=2))
+        click.echo(dumps_indented(data))
 
     def _print_csv(self, publications: List[Publication]) -> None:
         """Print publications as CSV."""
@@ -137,7 +137,7 @@ class ConsoleReporter:
 
         # Write data
         for pub in publications:
-            authors = "; ".join(str(a) for a in pub.authors)
+            authors = "; ".join(map(str, pub.authors))
             writer.writerow(
                 [
                     pub.title,
@@ -320,9 +320,7 @@ class AnalysisReporter:
                 if self.verbose:
                     click.echo(f"  Publication: {rec.publication.title[:60]}...")
                     if rec.publication.authors:
-                        author_str = ", ".join(
-                            str(a) for a in rec.publication.authors[:2]
-                        )
+                        author_str = ", ".join(map(str, rec.publication.authors[:2]))
                         click.echo(f"  Authors: {author_str}")
                     click.echo(f"  Year: {rec.publication.year or 'Unknown'}")
                     click.echo()
@@ -25,6 +25,9 @@ class ScholarSource(PublicationSource):
         self.logger = logging.getLogger(__name__)
         self.user_id = self._extract_scholar_id(self.url)
         self._session = get_session_for_url("https://scholar.google.com")
+        # One User-Agent per source: switching it between the pages of a
+        # single profile looks more bot-like than keeping it stable
+        self._headers = get_headers_with_random_user_agent()
         self.logger.info(f"Initialized Scholar source for user {self.user_id}")
 
     def _extract_scholar_id(self, url: str) -> str:
@@ -53,8 +56,8 @@ class ScholarSource(PublicationSource):
         return f"{base_url}?{params}"
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get headers with proper User-Agent."""
-        return get_headers_with_random_user_agent()
+        """Get headers with the User-Agent chosen for this source."""
+        return self._headers
 
     def _apply_rate_limit(self) -> None:
         """Apply random delay to avoid being blocked."""
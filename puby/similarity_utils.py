@@ -5,12 +5,30 @@ the codebase to eliminate duplication and ensure consistency.
 """
 
 import re
-from typing import List, Set
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, List
 
+# Characters normalize_text replaces with spaces: anything that is neither
+# a word character nor whitespace
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
 
+# The same replacement for ASCII text, applied by str.translate
+_ASCII_PUNCTUATION_TABLE = str.maketrans(
+    {
+        c: " "
+        for c in map(chr, range(128))
+        if not (c.isalnum() or c.isspace() or c == "_")
+    }
+)
+
+
+@lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
     """Normalize text for similarity comparison.
     
+    Results are cached, since the matcher normalizes each title and journal
+    once per pairwise comparison.
+    
     Args:
         text: The text to normalize
         
@@ -21,12 +39,36 @@ def normalize_text(text: str) -> str:
         return ""
     
     # Remove punctuation, extra spaces, convert to lowercase
-    normalized = re.sub(r"[^\w\s]", " ", text.lower())
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    return normalized
+    normalized = text.lower()
+    if normalized.isascii():
+        normalized = normalized.translate(_ASCII_PUNCTUATION_TABLE)
+    else:
+        normalized = _PUNCTUATION_RE.sub(" ", normalized)
+    return " ".join(normalized.split())
+
+
+@lru_cache(maxsize=8192)
+def normalized_word_set(text: str) -> FrozenSet[str]:
+    """Return the set of words in the normalized text.
+    
+    Args:
+        text: The text to split into words
+        
+    Returns:
+        Frozen set of words from normalize_text(text)
+    """
+    return frozenset(normalize_text(text).split())
+
+
+@lru_cache(maxsize=8192)
+def _word_set(text: str) -> FrozenSet[str]:
+    """Return the set of whitespace-separated words in text."""
+    return frozenset(text.split())
 
 
-def calculate_jaccard_similarity(words1: Set[str], words2: Set[str]) -> float:
+def calculate_jaccard_similarity(
+    words1: AbstractSet[str], words2: AbstractSet[str]
+) -> float:
     """Calculate Jaccard similarity between two sets of words.
     
     Args:
@@ -39,10 +81,11 @@ def calculate_jaccard_similarity(words1: Set[str], words2: Set[str]) -> float:
     if not words1 or not words2:
         return 0.0
     
+    # The union size follows from the intersection without building a set
     intersection = len(words1 & words2)
-    union = len(words1 | words2)
+    union = len(words1) + len(words2) - intersection
     
-    return intersection / union if union > 0 else 0.0
+    return intersection / union
 
 
 def calculate_simple_similarity(s1: str, s2: str) -> float:
@@ -80,9 +123,9 @@ def calculate_enhanced_title_similarity(title1: str, title2: str) -> float:
     if not title1 or not title2:
         return 0.0
 
-    # Split into words
-    words1 = set(title1.split())
-    words2 = set(title2.split())
+    # Split into words (cached, titles are compared pairwise)
+    words1 = _word_set(title1)
+    words2 = _word_set(title2)
 
     if not words1 or not words2:
         return 0.0
@@ -151,8 +194,8 @@ def calculate_title_similarity_with_length_penalty(title1: str, title2: str) ->
         return 1.0
 
     # Word-based Jaccard similarity
-    words1 = set(norm1.split())
-    words2 = set(norm2.split())
+    words1 = normalized_word_set(title1)
+    words2 = normalized_word_set(title2)
 
     if not words1 or not words2:
         return 0.0
@@ -165,7 +208,9 @@ def calculate_title_similarity_with_length_penalty(title1: str, title2: str) ->
     return jaccard * len_ratio
 
 
-def calculate_author_set_similarity(names1: Set[str], names2: Set[str]) -> float:
+def calculate_author_set_similarity(
+    names1: AbstractSet[str], names2: AbstractSet[str]
+) -> float:
     """Calculate similarity between two sets of normalized author names.
     
     Args:
@@ -3,6 +3,9 @@
 import re
 from typing import Optional
 
+# Four-digit years from 1900 to 2099
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
 
 def extract_year_from_text(text: str) -> Optional[int]:
     """Extract a 4-digit year from text using regex.
@@ -19,7 +22,7 @@ def extract_year_from_text(text: str) -> Optional[int]:
         return None
         
     # Match 4-digit years starting with 19 or 20
-    year_match = re.search(r'\b(19|20)\d{2}\b', text.strip())
+    year_match = _YEAR_RE.search(text.strip())
     if year_match:
         try:
             return int(year_match.group())
@@ -28,29 +31,6 @@ def extract_year_from_text(text: str) -> Optional[int]:
     return None
 
 
-def extract_year_from_bibtex_field(entry: str) -> Optional[int]:
-    """Extract year from BibTeX entry year field.
-    
-    Args:
-        entry: BibTeX entry text
-        
-    Returns:
-        Extracted year as integer, or None if not found
-    """
-    if not entry:
-        return None
-        
-    year_match = re.search(r"year\s*=\s*\{([^}]+)\}", entry, re.IGNORECASE)
-    year_str = year_match.group(1) if year_match else ""
-    
-    if year_str:
-        try:
-            return int(year_str.strip())
-        except ValueError:
-            pass
-    return None
-
-
 def safe_int_from_value(value) -> Optional[int]:
     """Safely convert a value to integer.
     
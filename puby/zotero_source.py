@@ -2,17 +2,39 @@
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union, cast
 
 import requests
 from pyzotero import zotero  # type: ignore
 
 from .base import PublicationSource
 from .bibtex_parser import BibtexParser
-from .constants import ZOTERO_API_KEY_URL, ZOTERO_API_KEY_INVALID_ERROR
+from .constants import (
+    ZOTERO_API_KEY_INVALID_ERROR,
+    ZOTERO_API_KEY_URL,
+    ZOTERO_MAX_CONCURRENT_REQUESTS,
+)
 from .models import Author, Publication, ZoteroConfig
 from .author_utils import create_structured_author, create_fallback_author
 from .http_utils import get_session_for_url
+from .json_utils import parse_json_response
+
+# First four-digit run in a Zotero date field
+_YEAR_RE = re.compile(r"\d{4}")
+
+# Zotero item types treated as publications
+_PUBLICATION_ITEM_TYPES = frozenset(
+    (
+        "journalArticle",
+        "book",
+        "bookSection",
+        "conferencePaper",
+        "thesis",
+        "report",
+        "preprint",
+    )
+)
 
 
 class ZoteroSource(PublicationSource):
@@ -20,9 +42,9 @@ class ZoteroSource(PublicationSource):
 
     def __init__(self, config: ZoteroConfig):
         """Initialize Zotero source with configuration."""
-        if not config.is_valid():
-            errors = ", ".join(config.validation_errors())
-            raise ValueError(f"Invalid Zotero configuration: {errors}")
+        errors = config.validation_errors()
+        if errors:
+            raise ValueError(f"Invalid Zotero configuration: {', '.join(errors)}")
 
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -109,7 +131,7 @@ class ZoteroSource(PublicationSource):
         try:
             response = self._session.get(url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json_response(response)
 
             # Extract user ID from response
             user_id = data.get("userID")
@@ -169,13 +191,23 @@ class ZoteroSource(PublicationSource):
         return self._fetch_library_items()
 
     def _fetch_library_items(self) -> List[Publication]:
-        """Fetch publications from regular Zotero library."""
+        """Fetch publications from regular Zotero library.
+
+        As for My Publications, the first page's ``Total-Results`` header
+        lets the remaining pages be requested concurrently. Without it,
+        pyzotero's everything() follows the ``next`` links page by page.
+        """
         publications = []
+        limit = 100
 
         try:
-            # Use everything() to handle pagination automatically
-            # This fetches all items in batches, handling Zotero's pagination
-            items = self.zot.everything(self.zot.top())
+            items = self.zot.top(limit=limit)
+            # pyzotero keeps its last response, which is requests- or httpx-based
+            total = self._parse_total_results(getattr(self.zot, "request", None))
+            if total is None:
+                items = self.zot.everything(items)
+            else:
+                items.extend(self._fetch_remaining_library_pages(limit, total))
 
             self.logger.info(f"Retrieved {len(items)} items from Zotero")
 
@@ -224,27 +256,77 @@ class ZoteroSource(PublicationSource):
         self.logger.info(f"Parsed {len(publications)} publications from Zotero")
         return publications
 
+    def _fetch_remaining_library_pages(
+        self, limit: int, total: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch top-level library items after the first page in parallel.
+
+        pyzotero keeps per-request state on the client, so the pages are
+        requested through the pooled session instead. Items keep page order.
+        """
+        starts = range(limit, total, limit)
+        if not starts:
+            return []
+
+        url = (
+            f"{self.zot.endpoint}/{self.zot.library_type}/"
+            f"{self.zot.library_id}/items/top"
+        )
+        headers = {
+            "Zotero-API-Key": self.config.api_key,
+            "Zotero-API-Version": "3",
+            "Accept": "application/json",
+        }
+
+        def fetch_page(start: int) -> List[Dict[str, Any]]:
+            params: Dict[str, Union[str, int]] = {
+                "format": "json",
+                "start": start,
+                "limit": limit,
+            }
+            response = self._session.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            return cast(List[Dict[str, Any]], parse_json_response(response))
+
+        self.logger.info(
+            f"Fetching {len(starts)} more library pages ({total} items)"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(len(starts), ZOTERO_MAX_CONCURRENT_REQUESTS)
+        ) as executor:
+            return [item for page in executor.map(fetch_page, starts) for item in page]
+
     def _fetch_my_publications(self) -> List[Publication]:
-        """Fetch publications from Zotero My Publications endpoint."""
+        """Fetch publications from Zotero My Publications endpoint.
+
+        The first page reports the library size in its ``Total-Results``
+        header; the remaining pages are then requested concurrently instead
+        of walking ``start=`` one round trip at a time.
+        """
         user_id = self._get_my_publications_user_id()
         self.logger.info(f"Fetching from My Publications endpoint for user {user_id}")
 
         publications = []
-        start = 0
         limit = 100
 
         try:
-            while True:
-                page_pubs = self._fetch_my_publications_page(user_id, start, limit)
-                if not page_pubs:
-                    break
-
-                publications.extend(page_pubs)
-
-                # Handle pagination
-                if self.config.format == "bibtex" or len(page_pubs) < limit:
-                    break
-                start += limit
+            response = self._get_my_publications_page(user_id, 0, limit)
+            page_pubs = self._parse_my_publications_response(response)
+            publications.extend(page_pubs)
+
+            # Handle pagination
+            if self.config.format != "bibtex" and len(page_pubs) >= limit:
+                total = self._parse_total_results(response)
+                if total is None:
+                    publications.extend(
+                        self._fetch_remaining_pages_serially(user_id, limit)
+                    )
+                else:
+                    publications.extend(
+                        self._fetch_remaining_pages_concurrently(
+                            user_id, limit, total
+                        )
+                    )
 
         except Exception as e:
             self._handle_my_publications_error(e)
@@ -254,6 +336,51 @@ class ZoteroSource(PublicationSource):
         )
         return publications
 
+    def _parse_total_results(
+        self, response: Optional[requests.Response]
+    ) -> Optional[int]:
+        """Return the ``Total-Results`` header as int, or None if unusable."""
+        if response is None:
+            return None
+        try:
+            return int(response.headers["Total-Results"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _fetch_remaining_pages_concurrently(
+        self, user_id: str, limit: int, total: int
+    ) -> List[Publication]:
+        """Fetch pages after the first in parallel, keeping page order."""
+        starts = range(limit, total, limit)
+        if not starts:
+            return []
+
+        self.logger.info(
+            f"Fetching {len(starts)} more My Publications pages ({total} items)"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(len(starts), ZOTERO_MAX_CONCURRENT_REQUESTS)
+        ) as executor:
+            pages = executor.map(
+                lambda start: self._fetch_my_publications_page(user_id, start, limit),
+                starts,
+            )
+            return [pub for page in pages for pub in page]
+
+    def _fetch_remaining_pages_serially(
+        self, user_id: str, limit: int
+    ) -> List[Publication]:
+        """Walk pages after the first until a short page is returned."""
+        publications: List[Publication] = []
+        start = limit
+        while True:
+            page_pubs = self._fetch_my_publications_page(user_id, start, limit)
+            publications.extend(page_pubs)
+            if len(page_pubs) < limit:
+                break
+            start += limit
+        return publications
+
     def _get_my_publications_user_id(self) -> str:
         """Get user ID for My Publications endpoint."""
         if self.config.library_type != "user":
@@ -271,13 +398,20 @@ class ZoteroSource(PublicationSource):
         self, user_id: str, start: int, limit: int
     ) -> List[Publication]:
         """Fetch a single page of My Publications."""
+        response = self._get_my_publications_page(user_id, start, limit)
+        return self._parse_my_publications_response(response)
+
+    def _get_my_publications_page(
+        self, user_id: str, start: int, limit: int
+    ) -> requests.Response:
+        """Request a single page of My Publications and validate the response."""
         url = f"https://api.zotero.org/users/{user_id}/publications/items"
         headers, params = self._build_my_publications_request(start, limit)
 
         response = self._session.get(url, headers=headers, params=params)
         self._validate_my_publications_response(response)
 
-        return self._parse_my_publications_response(response)
+        return response
 
     def _build_my_publications_request(self, start: int, limit: int) -> tuple:
         """Build request headers and parameters for My Publications."""
@@ -312,9 +446,12 @@ class ZoteroSource(PublicationSource):
         """Parse My Publications API response."""
         if self.config.format == "bibtex":
             parser = BibtexParser(self.logger)
-            return parser.parse_bibtex_response(response.text)
+            # Without a declared charset, response.text runs encoding detection
+            # over the whole payload; Zotero serves UTF-8, so hand over the bytes
+            content = response.content if response.encoding is None else response.text
+            return parser.parse_bibtex_response(content)
         else:
-            items = response.json()
+            items = parse_json_response(response)
             publications = []
             for item in items:
                 pub = self._parse_zotero_item(item)
@@ -344,16 +481,7 @@ class ZoteroSource(PublicationSource):
 
     def _is_publication_item(self, item_type: str) -> bool:
         """Check if Zotero item type represents a publication."""
-        publication_types = [
-            "journalArticle",
-            "book",
-            "bookSection",
-            "conferencePaper",
-            "thesis",
-            "report",
-            "preprint",
-        ]
-        return item_type in publication_types
+        return item_type in _PUBLICATION_ITEM_TYPES
 
     def _parse_zotero_creators(self, data: Dict[str, Any]) -> List[Author]:
         """Extract and parse authors from Zotero creators data using shared utilities."""
@@ -377,7 +505,7 @@ class ZoteroSource(PublicationSource):
     def _parse_publication_year(self, date_str: str) -> Optional[int]:
         """Parse publication year from Zotero date field."""
         if date_str:
-            year_match = re.search(r"\d{4}", date_str)
+            year_match = _YEAR_RE.search(date_str)
             if year_match:
                 return int(year_match.group())
         return None
@@ -353,4 +353,22 @@ class TestEdgeCases:
         
         # Should filter all variations of separator words
         assert len(result) == 3
-        assert all(author.name not in ["AND", "&", "And", "and"] for author in result)
\ No newline at end of file
+        assert all(author.name not in ["AND", "&", "And", "and"] for author in result)
+
+    def test_repeated_names_share_cached_author(self):
+        """Test that repeated names reuse the same immutable Author."""
+        first = parse_bibtex_authors("Smith, John and Smith, John")
+        
+        assert first[0] is first[1]
+        
+        second = parse_comma_separated_authors("John Smith, John Smith")
+        assert second[0] is second[1]
+
+    def test_name_strings_are_interned(self):
+        """Test that equal name strings are shared between authors."""
+        first = create_structured_author(
+            first_name="John", last_name="".join(["Sm", "ith"])
+        )
+        second = parse_bibtex_authors("".join(["Smith", ", Jane"]))[0]
+        
+        assert first.family_name is second.family_name
@@ -0,0 +1,148 @@
+"""Tests for BibTeX parsing utilities."""
+
+from puby.bibtex_parser import BibtexParser, _iter_entries, _scan_fields
+
+
+class TestScanFields:
+    """Test single-pass BibTeX field scanning."""
+
+    def test_braced_fields(self):
+        """Test extraction of braced field values."""
+        fields = _scan_fields("key,\n  title = {Test Title},\n  year = {2023}\n}")
+        assert fields["title"] == "Test Title"
+        assert fields["year"] == "2023"
+
+    def test_nested_braces(self):
+        """Test that nested braces are kept inside the value."""
+        fields = _scan_fields("key, title = {The {GPU} Approach}, year = {2023}}")
+        assert fields["title"] == "The {GPU} Approach"
+        assert fields["year"] == "2023"
+
+    def test_quoted_and_bare_values(self):
+        """Test extraction of quoted and bare field values."""
+        fields = _scan_fields('key, journal = "Nature", year = 2020\n}')
+        assert fields["journal"] == "Nature"
+        assert fields["year"] == "2020"
+
+    def test_case_insensitive_keys(self):
+        """Test that field names are lowercased."""
+        fields = _scan_fields("key, TITLE = {Test}, Year = {2023}}")
+        assert fields["title"] == "Test"
+        assert fields["year"] == "2023"
+
+    def test_similar_field_names_are_distinct(self):
+        """Test that booktitle does not shadow title."""
+        fields = _scan_fields("key, booktitle = {Proceedings}, title = {Paper}}")
+        assert fields["title"] == "Paper"
+        assert fields["booktitle"] == "Proceedings"
+
+    def test_first_occurrence_wins(self):
+        """Test that the first occurrence of a duplicate key is kept."""
+        fields = _scan_fields("key, year = {2020}, year = {2023}}")
+        assert fields["year"] == "2020"
+
+    def test_empty_values_skipped(self):
+        """Test that empty values are not recorded."""
+        assert "doi" not in _scan_fields("key, doi = {}, title = {Test}}")
+
+    def test_wanted_fields_only(self):
+        """Test that only requested fields are collected."""
+        entry = "key, abstract = {Long text}, title = {Test}, year = {2023}}"
+        fields = _scan_fields(entry, frozenset(("title", "year")))
+        assert fields == {"title": "Test", "year": "2023"}
+
+
+class TestIterEntries:
+    """Test splitting a BibTeX document into entries."""
+
+    def test_splits_entries(self):
+        """Test that each entry body is yielded without its braces."""
+        content = "@article{a, title = {A}}\n@book {b, title = {B}}\n"
+        assert list(_iter_entries(content)) == ["a, title = {A}", "b, title = {B}"]
+
+    def test_nested_braces_stay_in_entry(self):
+        """Test that nested braces do not end an entry early."""
+        content = "@article{a, title = {The {GPU} Way}, year = {2020}}"
+        assert list(_iter_entries(content)) == [
+            "a, title = {The {GPU} Way}, year = {2020}"
+        ]
+
+    def test_at_sign_inside_value(self):
+        """Test that '@' inside a value does not start a new entry."""
+        content = "@misc{a, note = {mail x@y.org {z}}}\n@misc{b, title = {B}}"
+        assert len(list(_iter_entries(content))) == 2
+
+    def test_ignores_preamble_and_stray_at(self):
+        """Test that text before entries and invalid headers are skipped."""
+        content = "Exported by me @ home\n@article{a, title = {A}}"
+        assert list(_iter_entries(content)) == ["a, title = {A}"]
+
+    def test_unterminated_entry(self):
+        """Test that an unterminated entry yields the remaining text."""
+        assert list(_iter_entries("@article{a, title = {A}")) == ["a, title = {A}"]
+
+
+class TestBibtexParser:
+    """Test parsing of full BibTeX responses."""
+
+    def test_parse_multiple_entries(self):
+        """Test parsing a response with several entries."""
+        content = (
+            "@article{Smith2020,\n"
+            "  title = {First Paper},\n"
+            "  author = {Smith, John and Doe, Jane},\n"
+            "  year = {2020},\n"
+            "  journal = {Nature},\n"
+            "  doi = {10.1000/test}\n"
+            "}\n\n"
+            "@book{Lee2019,\n"
+            "  title = {Second Book},\n"
+            "  year = {2019}\n"
+            "}\n"
+        )
+        pubs = BibtexParser().parse_bibtex_response(content)
+
+        assert len(pubs) == 2
+        assert pubs[0].title == "First Paper"
+        assert pubs[0].year == 2020
+        assert pubs[0].journal == "Nature"
+        assert pubs[0].doi == "10.1000/test"
+        assert [a.family_name for a in pubs[0].authors] == ["Smith", "Doe"]
+        assert pubs[0].source == "Zotero My Publications"
+        assert pubs[1].authors[0].name == "[No authors]"
+
+    def test_iter_bibtex_response_is_lazy(self):
+        """Test that the iterator yields publications one at a time."""
+        content = "@article{a, title = {A}}\n@article{b, title = {B}}"
+        pubs = BibtexParser().iter_bibtex_response(content)
+
+        assert next(pubs).title == "A"
+        assert next(pubs).title == "B"
+        assert next(pubs, None) is None
+
+    def test_parse_bytes_as_utf8(self):
+        """Test that raw response bytes are decoded as UTF-8."""
+        content = "@article{a, title = {Café}, author = {Müller, Jörg}}".encode()
+        pubs = BibtexParser().parse_bibtex_response(content)
+
+        assert pubs[0].title == "Café"
+        assert pubs[0].authors[0].family_name == "Müller"
+
+    def test_raw_entry_only_kept_on_request(self):
+        """Test that the raw entry text is only stored when keep_raw is set."""
+        entry = "a, title = {A}"
+
+        assert BibtexParser().parse_bibtex_entry(entry).raw_data == {}
+        kept = BibtexParser(keep_raw=True).parse_bibtex_entry(entry)
+        assert kept.raw_data == {"bibtex": entry}
+
+    def test_entry_without_title_skipped(self):
+        """Test that entries without a title are skipped."""
+        pubs = BibtexParser().parse_bibtex_response("@misc{key, year = {2020}}")
+        assert pubs == []
+
+    def test_invalid_year(self):
+        """Test that a non-numeric year is ignored."""
+        pub = BibtexParser().parse_bibtex_entry("key, title = {T}, year = {n.d.}}")
+        assert pub is not None
+        assert pub.year is None
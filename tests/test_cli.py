@@ -1,5 +1,7 @@
 """Tests for CLI interface."""
 
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 from click.testing import CliRunner
@@ -8,6 +10,26 @@ from puby.cli import cli
 from puby.models import Author, Publication, ZoteroConfig
 
 
+def _fetch_results(zotero_source_cls, sources, zotero):
+    """Build a fetch_publications side effect that tells Zotero apart.
+
+    The Zotero library is fetched concurrently with the other sources, so
+    results cannot be assigned by call order. Exceptions are raised.
+    """
+    source_results = iter(sources)
+
+    def fetch(source):
+        if source is zotero_source_cls.return_value:
+            result = zotero
+        else:
+            result = next(source_results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch
+
+
 class TestCLI:
     """Test CLI commands and integration."""
 
@@ -17,6 +39,22 @@ class TestCLI:
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         assert "Puby - Publication list management tool" in result.output
+        assert "check  Compare publications across sources" in result.output
+        assert "fetch  Fetch publications from ORCID" in result.output
+
+    def test_lazy_help_matches_command_help(self):
+        """Test the help listed for lazy commands matches their docstrings."""
+        for name, help_text in cli.lazy_help.items():
+            assert cli.get_command(None, name).help == help_text
+
+    def test_fetch_command_does_not_import_zotero(self):
+        """Test that loading the ORCID-only fetch command skips pyzotero."""
+        code = "import sys, puby.commands.fetch; print('pyzotero' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
 
     def test_check_command_help(self):
         """Test check command help."""
@@ -73,6 +111,22 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Invalid Scholar URL" in result.output
 
+    def test_check_lookalike_scholar_host_rejected(self):
+        """Test that hosts merely containing scholar.google.com are rejected."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "check",
+                "--scholar",
+                "https://scholar.google.com.evil.example/citations?user=x",
+                "--zotero",
+                "12345",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Invalid Scholar URL" in result.output
+
     def test_check_invalid_pure_url(self):
         """Test check command with non-HTTPS Pure URL."""
         runner = CliRunner()
@@ -119,10 +173,13 @@ class TestCLI:
         # Configure mocks
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub1, mock_pub2],  # ORCID publications
-            [mock_pub3],  # Zotero publications (has duplicate)
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub1, mock_pub2],  # ORCID publications
+            ],
+            zotero=[mock_pub3],  # Zotero publications (has duplicate)
+        )
 
         # Mock ZoteroSource instance
         mock_zotero_instance = Mock()
@@ -169,10 +226,13 @@ class TestCLI:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [orcid_pub],  # ORCID has publication
-            [],  # Zotero is empty
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [orcid_pub],  # ORCID has publication
+            ],
+            zotero=[],  # Zotero is empty
+        )
 
         # Mock ZoteroSource instance
         mock_zotero_instance = Mock()
@@ -209,10 +269,13 @@ class TestCLI:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub],  # ORCID
-            [],  # Zotero empty
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub],  # ORCID
+            ],
+            zotero=[],  # Zotero empty
+        )
 
         # Mock ZoteroSource instance
         mock_zotero_instance = Mock()
@@ -295,11 +358,14 @@ class TestCLI:
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
         # Need 3 calls: Scholar, ORCID, then Zotero
-        mock_client_instance.fetch_publications.side_effect = [
-            [Publication(title="Scholar Pub", authors=[], year=2023)],  # Scholar
-            [Publication(title="ORCID Pub", authors=[], year=2023)],  # ORCID
-            [Publication(title="Zotero Pub", authors=[], year=2023)],  # Zotero
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [Publication(title="Scholar Pub", authors=[], year=2023)],  # Scholar
+                [Publication(title="ORCID Pub", authors=[], year=2023)],  # ORCID
+            ],
+            zotero=[Publication(title="Zotero Pub", authors=[], year=2023)],  # Zotero
+        )
 
         # Mock ZoteroSource instance
         mock_zotero_instance = Mock()
@@ -371,6 +437,30 @@ class TestCLI:
         assert "Successfully saved" in result.output
         assert "test.bib" in result.output
 
+    @patch("puby.commands.fetch.disable_http_cache")
+    @patch("puby.commands.fetch.PublicationClient")
+    @patch("puby.commands.fetch.ORCIDSource")
+    def test_fetch_command_no_cache(
+        self, mock_orcid_source, mock_client, mock_disable_cache
+    ):
+        """Test that fetch --no-cache bypasses the HTTP response cache."""
+        mock_client.return_value.fetch_publications.return_value = []
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(
+                cli,
+                [
+                    "fetch",
+                    "--orcid",
+                    "https://orcid.org/0000-0000-0000-0000",
+                    "--no-cache",
+                ],
+            )
+
+        assert result.exit_code == 0
+        mock_disable_cache.assert_called_once_with()
+
     @patch("puby.commands.fetch.PublicationClient")
     @patch("puby.commands.fetch.ORCIDSource")
     def test_fetch_command_source_error(self, mock_orcid_source, mock_client):
@@ -531,10 +621,13 @@ class TestCLI:
             mock_zotero.return_value = Mock()
             # Mock the first call (for ORCID) to return some data,
             # and the second call (for Zotero) to raise the error  
-            mock_client_instance.fetch_publications.side_effect = [
-                [Mock()],  # ORCID fetch succeeds
-                ValueError("Authentication failed")  # Zotero fetch fails
-            ]
+            mock_client_instance.fetch_publications.side_effect = _fetch_results(
+                mock_zotero,
+                sources=[
+                    [Mock()],  # ORCID fetch succeeds
+                ],
+                zotero=ValueError("Authentication failed"),  # Zotero fetch fails
+            )
             
             check_result2 = runner.invoke(
                 cli,
@@ -683,10 +776,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub],  # ORCID publications
-            [mock_pub],  # Zotero publications
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub],  # ORCID publications
+            ],
+            zotero=[mock_pub],  # Zotero publications
+        )
 
         # Mock ZoteroSource initialization
         mock_zotero_instance = Mock()
@@ -732,10 +828,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub],  # ORCID
-            [mock_pub],  # Zotero
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub],  # ORCID
+            ],
+            zotero=[mock_pub],  # Zotero
+        )
 
         mock_zotero_instance = Mock()
         mock_zotero_source.return_value = mock_zotero_instance
@@ -778,10 +877,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub],  # ORCID
-            [mock_pub],  # Zotero
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub],  # ORCID
+            ],
+            zotero=[mock_pub],  # Zotero
+        )
 
         mock_zotero_instance = Mock()
         mock_zotero_source.return_value = mock_zotero_instance
@@ -896,10 +998,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub],  # ORCID
-            [mock_pub],  # Zotero
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub],  # ORCID
+            ],
+            zotero=[mock_pub],  # Zotero
+        )
 
         mock_zotero_instance = Mock()
         mock_zotero_source.return_value = mock_zotero_instance
@@ -944,10 +1049,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [missing_pub],  # ORCID has publication
-            [],  # Zotero is empty
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [missing_pub],  # ORCID has publication
+            ],
+            zotero=[],  # Zotero is empty
+        )
 
         # Mock ZoteroSource instance
         mock_zotero_instance = Mock()
@@ -974,6 +1082,72 @@ class TestCLIZoteroSourceIntegration:
         # Verify export function was called with correct arguments
         mock_export.assert_called_once_with([missing_pub], "missing_pubs.bib")
 
+    @patch("puby.commands.check._export_missing_publications")
+    @patch("puby.commands.check.PublicationClient")
+    @patch("puby.commands.check.ORCIDSource")
+    @patch("puby.commands.check.ZoteroSource")
+    def test_check_command_only_export_skips_reports(
+        self, mock_zotero_source, mock_orcid_source, mock_client, mock_export
+    ):
+        """Test that --only-export skips duplicate and potential-match passes."""
+        missing_pub = Publication(
+            title="Missing Paper",
+            authors=[Author(name="John Doe")],
+            year=2023,
+            doi="10.1000/missing",
+        )
+
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source, sources=[[missing_pub]], zotero=[]
+        )
+
+        runner = CliRunner()
+        with patch(
+            "puby.commands.check.PublicationMatcher.find_duplicates"
+        ) as mock_duplicates, patch(
+            "puby.commands.check.PublicationMatcher.find_potential_matches"
+        ) as mock_potential:
+            result = runner.invoke(
+                cli,
+                [
+                    "check",
+                    "--orcid",
+                    "https://orcid.org/0000-0000-0000-0000",
+                    "--zotero",
+                    "12345",
+                    "--export-missing",
+                    "missing_pubs.bib",
+                    "--only-export",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert "Exported 1 missing publications to missing_pubs.bib" in result.output
+        assert "Summary:" not in result.output
+        mock_export.assert_called_once_with([missing_pub], "missing_pubs.bib")
+        mock_duplicates.assert_not_called()
+        mock_potential.assert_not_called()
+
+    def test_check_command_only_export_requires_export_missing(self):
+        """Test that --only-export without --export-missing is rejected."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "check",
+                "--orcid",
+                "https://orcid.org/0000-0000-0000-0000",
+                "--zotero",
+                "12345",
+                "--only-export",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "--only-export requires --export-missing" in result.output
+
     @patch("puby.commands.check._export_missing_publications")
     @patch("puby.commands.check.PublicationClient")
     @patch("puby.commands.check.ORCIDSource")
@@ -990,10 +1164,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [missing_pub],  # ORCID has publication
-            [],  # Zotero is empty
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [missing_pub],  # ORCID has publication
+            ],
+            zotero=[],  # Zotero is empty
+        )
 
         mock_zotero_instance = Mock()
         mock_zotero_source.return_value = mock_zotero_instance
@@ -1037,10 +1214,13 @@ class TestCLIZoteroSourceIntegration:
 
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
-        mock_client_instance.fetch_publications.side_effect = [
-            [mock_pub],  # ORCID has publication
-            [mock_pub],  # Zotero has same publication
-        ]
+        mock_client_instance.fetch_publications.side_effect = _fetch_results(
+            mock_zotero_source,
+            sources=[
+                [mock_pub],  # ORCID has publication
+            ],
+            zotero=[mock_pub],  # Zotero has same publication
+        )
 
         mock_zotero_instance = Mock()
         mock_zotero_source.return_value = mock_zotero_instance
@@ -1,6 +1,8 @@
 """Tests for CLI internal helper functions to achieve 80% coverage."""
 
 import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -9,8 +11,7 @@ import pytest
 from puby.commands.check import (
     _analyze_publications,
     _export_missing_publications,
-    _fetch_source_publications,
-    _fetch_zotero_publications,
+    _fetch_all_publications,
     _initialize_sources,
     _initialize_zotero_source,
     _print_summary,
@@ -288,57 +289,70 @@ class TestCLIInternalFunctions:
                 for call in calls
             )
 
-    @patch("click.echo")
-    @patch("puby.cli.PublicationClient")
-    def test_fetch_source_publications_verbose(self, mock_client, mock_echo):
-        """Test fetch source publications with verbose output."""
-        mock_client_instance = Mock()
-        mock_client.return_value = mock_client_instance
+    @staticmethod
+    def _zotero_source():
+        """Create a mock Zotero source for an auto-discovered user library."""
+        zotero_source = Mock()
+        zotero_source.config.library_type = "user"
+        zotero_source.config.group_id = None
+        return zotero_source
 
+    @patch("click.echo")
+    def test_fetch_all_publications_verbose(self, mock_echo):
+        """Test fetch of sources and Zotero with verbose output."""
         # Create mock sources
         mock_source1 = Mock()
         mock_source1.__class__.__name__ = "ORCIDSource"
         mock_source2 = Mock()
         mock_source2.__class__.__name__ = "ScholarSource"
-
-        sources = [mock_source1, mock_source2]
+        zotero_source = self._zotero_source()
 
         # Mock publications returned
-        mock_client_instance.fetch_publications.side_effect = [
-            [Mock(), Mock()],  # 2 pubs from ORCID
-            [Mock()],  # 1 pub from Scholar
+        publications = {
+            id(mock_source1): [Mock(), Mock()],  # 2 pubs from ORCID
+            id(mock_source2): [Mock()],  # 1 pub from Scholar
+            id(zotero_source): [Mock(), Mock(), Mock()],  # 3 pubs from Zotero
+        }
+        client = Mock()
+        client.fetch_publications.side_effect = lambda source: publications[
+            id(source)
         ]
 
-        result = _fetch_source_publications(mock_client_instance, sources, verbose=True)
+        source_pubs, zotero_pubs = _fetch_all_publications(
+            client, [mock_source1, mock_source2], zotero_source, verbose=True
+        )
 
-        assert len(result) == 3  # Total publications
+        assert len(source_pubs) == 3  # Total publications
+        assert zotero_pubs == publications[id(zotero_source)]
 
         # Check verbose output messages
         calls = mock_echo.call_args_list
         assert any("Fetching publications from sources" in str(call) for call in calls)
         assert any("Fetching from ORCIDSource" in str(call) for call in calls)
         assert any("Fetching from ScholarSource" in str(call) for call in calls)
+        assert any(
+            "Fetching from Zotero user library (auto-discovered)" in str(call)
+            for call in calls
+        )
         assert any("Found 2 publications" in str(call) for call in calls)
         assert any("Found 1 publications" in str(call) for call in calls)
+        assert any("Found 3 publications" in str(call) for call in calls)
 
     @patch("click.echo")
-    @patch("puby.cli.PublicationClient")
-    def test_fetch_source_publications_not_verbose(self, mock_client, mock_echo):
-        """Test fetch source publications without verbose output."""
-        mock_client_instance = Mock()
-        mock_client.return_value = mock_client_instance
-
+    def test_fetch_all_publications_not_verbose(self, mock_echo):
+        """Test fetch of sources and Zotero without verbose output."""
         mock_source = Mock()
         mock_source.__class__.__name__ = "ORCIDSource"
-        sources = [mock_source]
 
-        mock_client_instance.fetch_publications.return_value = [Mock()]
+        client = Mock()
+        client.fetch_publications.return_value = [Mock()]
 
-        result = _fetch_source_publications(
-            mock_client_instance, sources, verbose=False
+        source_pubs, zotero_pubs = _fetch_all_publications(
+            client, [mock_source], self._zotero_source(), verbose=False
         )
 
-        assert len(result) == 1
+        assert len(source_pubs) == 1
+        assert len(zotero_pubs) == 1
 
         # Should only show main message, not per-source details
         calls = mock_echo.call_args_list
@@ -346,46 +360,72 @@ class TestCLIInternalFunctions:
         assert not any("Fetching from ORCIDSource" in str(call) for call in calls)
 
     @patch("click.echo")
-    @patch("puby.cli.PublicationClient")
-    def test_fetch_zotero_publications_success_verbose(self, mock_client, mock_echo):
-        """Test successful Zotero publications fetch with verbose output."""
-        mock_client_instance = Mock()
-        mock_zotero_source = Mock()
-        mock_zotero_source.config.library_type = "user"
-        mock_zotero_source.config.group_id = None
-
-        mock_publications = [Mock(), Mock(), Mock()]
-        mock_client_instance.fetch_publications.return_value = mock_publications
-
-        result = _fetch_zotero_publications(
-            mock_client_instance, mock_zotero_source, verbose=True
+    def test_fetch_all_publications_concurrent_keeps_order(self, mock_echo):
+        """Test sources are fetched concurrently but merged in source order."""
+        slow_source, fast_source = Mock(), Mock()
+        slow_pub, fast_pub = Mock(), Mock()
+        zotero_source = self._zotero_source()
+        started = threading.Barrier(3, timeout=5)
+
+        def fetch(source):
+            # All fetches must be in flight at once to pass the barrier
+            started.wait()
+            if source is zotero_source:
+                return []
+            if source is slow_source:
+                time.sleep(0.05)
+                return [slow_pub]
+            return [fast_pub]
+
+        client = Mock()
+        client.fetch_publications.side_effect = fetch
+
+        source_pubs, _ = _fetch_all_publications(
+            client, [slow_source, fast_source], zotero_source, verbose=False
         )
 
-        assert result == mock_publications
+        assert source_pubs == [slow_pub, fast_pub]
 
-        calls = mock_echo.call_args_list
-        assert any(
-            "Fetching from Zotero user library (auto-discovered)" in str(call)
-            for call in calls
-        )
-        assert any("Found 3 publications" in str(call) for call in calls)
+    @patch("click.echo")
+    def test_fetch_all_publications_zotero_auth_error_fails_fast(self, mock_echo):
+        """Test a Zotero authentication error is reported before sources finish."""
+        source = Mock()
+        source_released = threading.Event()
+        zotero_source = self._zotero_source()
 
-    # Skipping this test as the function behavior varies between implementations
+        def fetch(fetched):
+            if fetched is zotero_source:
+                raise ValueError("Zotero API authentication failed")
+            source_released.wait(timeout=5)
+            return []
 
-    @patch("click.echo")
-    @patch("puby.cli.PublicationClient")
-    def test_fetch_zotero_publications_other_error(self, mock_client, mock_echo):
-        """Test Zotero publications fetch handles non-authentication errors."""
-        mock_client_instance = Mock()
-        mock_zotero_source = Mock()
+        client = Mock()
+        client.fetch_publications.side_effect = fetch
+
+        try:
+            with pytest.raises(SystemExit) as exc_info:
+                _fetch_all_publications(client, [source], zotero_source, verbose=True)
+            # The source fetch is still blocked, so the exit did not wait for it
+            assert not source_released.is_set()
+        finally:
+            source_released.set()
+
+        assert exc_info.value.code == 1
+        errors = [str(call) for call in mock_echo.call_args_list if call.kwargs]
+        assert any("authentication failed" in call for call in errors)
+        assert not any("Found" in str(call) for call in mock_echo.call_args_list)
 
-        mock_client_instance.fetch_publications.side_effect = ValueError(
+    @patch("click.echo")
+    def test_fetch_all_publications_zotero_other_error(self, mock_echo):
+        """Test Zotero fetch re-raises non-authentication errors."""
+        client = Mock()
+        client.fetch_publications.side_effect = ValueError(
             "Invalid library configuration"
         )
 
         with pytest.raises(ValueError, match="Invalid library configuration"):
-            _fetch_zotero_publications(
-                mock_client_instance, mock_zotero_source, verbose=False
+            _fetch_all_publications(
+                client, [], self._zotero_source(), verbose=False
             )
 
     def test_export_missing_publications_empty_list(self, tmp_path):
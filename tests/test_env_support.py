@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 
 from click.testing import CliRunner
 
+from puby import env as puby_env
 from puby.cli import cli
 from puby.env import get_api_key, load_api_keys
 
@@ -243,3 +244,34 @@ class TestEnvSupport:
                     # python-dotenv should handle quotes properly
                     assert env_vars.get("ZOTERO_API_KEY") == "quoted_key"
                     assert env_vars.get("SINGLE_QUOTED") == "single_quoted_key"
+
+    def test_unchanged_env_file_is_not_reparsed(self):
+        """Test that an unchanged .env file is parsed only once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text("ZOTERO_API_KEY=cached_key\n")
+
+            cwd = patch("pathlib.Path.cwd", return_value=Path(tmpdir))
+            parse = patch("puby.env.dotenv_values", wraps=puby_env.dotenv_values)
+            with cwd, patch.dict(os.environ, {}, clear=True), parse as mock_parse:
+                first = load_api_keys()
+                second = load_api_keys()
+
+            assert first["ZOTERO_API_KEY"] == second["ZOTERO_API_KEY"] == "cached_key"
+            parsed = [call.args[0] for call in mock_parse.call_args_list]
+            assert parsed.count(env_file) == 1
+
+    def test_modified_env_file_is_reparsed(self):
+        """Test that edits to a .env file are picked up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text("ZOTERO_API_KEY=old_key\n")
+
+            cwd = patch("pathlib.Path.cwd", return_value=Path(tmpdir))
+            with cwd, patch.dict(os.environ, {}, clear=True):
+                assert load_api_keys()["ZOTERO_API_KEY"] == "old_key"
+
+                # load_api_keys exports the key; drop it so the file is used
+                del os.environ["ZOTERO_API_KEY"]
+                env_file.write_text("ZOTERO_API_KEY=new_key_value\n")
+                assert load_api_keys()["ZOTERO_API_KEY"] == "new_key_value"
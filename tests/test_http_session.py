@@ -3,8 +3,14 @@
 import pytest
 import requests
 from unittest.mock import Mock, patch
+from urllib3.response import HTTPResponse
 
-from puby.http_session import HTTPSessionManager, get_shared_session
+from puby.http_session import (
+    _MAX_RETRY_AFTER,
+    HTTPSessionManager,
+    _is_cacheable,
+    get_shared_session,
+)
 
 
 class TestHTTPSessionManager:
@@ -35,6 +41,15 @@ class TestHTTPSessionManager:
         session2 = manager.get_session("example.com")
         assert session1 is session2
 
+    def test_existing_session_returned_without_lock(self):
+        """Test that cached sessions are looked up without taking the lock."""
+        manager = HTTPSessionManager()
+        session = manager.get_session("example.com")
+
+        with patch.object(manager, "_session_lock") as mock_lock:
+            assert manager.get_session("example.com") is session
+            mock_lock.__enter__.assert_not_called()
+
     def test_session_different_for_different_domains(self):
         """Test that different sessions are used for different domains."""
         manager = HTTPSessionManager()
@@ -111,6 +126,37 @@ class TestConnectionPoolingIntegration:
         session2 = manager.get_session("example.com")
         assert session is session2  # Same session should be reused
 
+    def test_adapter_retry_policy(self):
+        """Test that transient failures are retried with backoff."""
+        manager = HTTPSessionManager()
+        retry = manager.get_session("example.com").get_adapter(
+            "https://example.com"
+        ).max_retries
+
+        assert retry.total == 3
+        assert retry.backoff_factor > 0
+        assert 429 in retry.status_forcelist
+        assert 503 in retry.status_forcelist
+        assert retry.respect_retry_after_header
+        assert "POST" not in retry.allowed_methods
+        # The last response is returned instead of raising, so sources
+        # can still report the HTTP status
+        assert not retry.raise_on_status
+
+    def test_retry_after_is_capped(self):
+        """Test that long Retry-After delays are clamped."""
+        manager = HTTPSessionManager()
+        retry = manager.get_session("example.com").get_adapter(
+            "https://example.com"
+        ).max_retries
+
+        long_wait = HTTPResponse(headers={"Retry-After": "3600"})
+        short_wait = HTTPResponse(headers={"Retry-After": "2"})
+        assert retry.get_retry_after(long_wait) == _MAX_RETRY_AFTER
+        assert retry.get_retry_after(short_wait) == 2
+        # Copies made while retrying keep the cap
+        assert retry.new().get_retry_after(long_wait) == _MAX_RETRY_AFTER
+
     def test_session_headers_preserved(self):
         """Test that session preserves custom headers."""
         manager = HTTPSessionManager()
@@ -130,4 +176,31 @@ class TestConnectionPoolingIntegration:
         
         # Session should allow timeout configuration
         # (This is more about the interface than implementation)
-        assert hasattr(session, 'request')
\ No newline at end of file
+        assert hasattr(session, 'request')
+
+
+class TestResponseCaching:
+    """Tests for the optional on-disk response cache."""
+
+    @staticmethod
+    def _response(request_headers, response_headers):
+        request = requests.Request("GET", "https://example.com").prepare()
+        request.headers.update(request_headers)
+        response = requests.Response()
+        response.request = request
+        response.headers.update(response_headers)
+        return response
+
+    def test_response_with_etag_is_cacheable(self):
+        """Test that public responses with a validator are cached."""
+        assert _is_cacheable(self._response({}, {"ETag": '"abc"'}))
+        assert _is_cacheable(self._response({}, {"Last-Modified": "Mon"}))
+
+    def test_response_without_validator_not_cacheable(self):
+        """Test that responses which cannot be revalidated are not cached."""
+        assert not _is_cacheable(self._response({}, {}))
+
+    def test_authenticated_zotero_response_not_cacheable(self):
+        """Test that responses to API-key requests are never cached."""
+        response = self._response({"Zotero-API-Key": "secret"}, {"ETag": '"abc"'})
+        assert not _is_cacheable(response)
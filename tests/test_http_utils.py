@@ -86,6 +86,13 @@ class TestDefaultHeaders:
             if key != "User-Agent":
                 assert headers1[key] == headers2[key]
 
+    def test_default_headers_are_independent_copies(self):
+        """Test that modifying returned headers does not affect later calls."""
+        headers = get_default_headers()
+        headers["User-Agent"] = "Modified"
+        
+        assert get_default_headers()["User-Agent"] in USER_AGENTS
+
 
 class TestRandomUserAgentHeaders:
     """Test random User-Agent header construction."""
@@ -0,0 +1,60 @@
+"""Tests for JSON decoding and encoding helpers."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from puby import json_utils
+from puby.json_utils import dumps_indented, parse_json_response
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if not json_utils.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_utils, "HAS_ORJSON", False)
+    return request.param
+
+
+class TestParseJsonResponse:
+    """Test decoding of JSON response bodies."""
+
+    def test_decodes_utf8_body(self, json_backend):
+        """Test that the raw body bytes are decoded."""
+        response = Mock()
+        response.content = '{"title": "Café", "year": 2023}'.encode()
+
+        assert parse_json_response(response) == {"title": "Café", "year": 2023}
+
+    def test_invalid_body_raises_requests_error(self, json_backend):
+        """Test that invalid JSON raises the same error as response.json()."""
+        response = Mock()
+        response.content = b"<html>Service unavailable</html>"
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            parse_json_response(response)
+
+
+class TestDumpsIndented:
+    """Test JSON output formatting."""
+
+    def test_matches_stdlib_layout(self, json_backend):
+        """Test that both backends produce identical indented output."""
+        data = [{"title": "Müller et al.", "authors": ["A"], "doi": None}]
+
+        assert dumps_indented(data) == json.dumps(data, indent=2)
+
+    def test_escapes_non_ascii_like_stdlib(self, json_backend):
+        """Test that non-ASCII text, including astral characters, is escaped."""
+        data = {"title": "Über «Lernen» \u2013 Ångström \U0001d53c", "year": 2023}
+
+        output = dumps_indented(data)
+
+        assert output.isascii()
+        assert output == json.dumps(data, indent=2)
+        assert json.loads(output) == data
@@ -1,7 +1,10 @@
 """Tests for publication matching and comparison utilities."""
 
+import pickle
+
 import pytest
 
+from puby import matcher as matcher_module
 from puby.matcher import MatchResult, PublicationMatcher
 from puby.models import Author, Publication
 
@@ -247,6 +250,138 @@ class TestPublicationMatcher:
         assert match.reference_publication == reference_pub
         assert 0.5 <= match.confidence < 0.8
 
+    def test_find_potential_matches_skips_doi_pairs(self, matcher):
+        """Test that pairs decided by their DOIs are not potential matches."""
+        source_pub = Publication(
+            title="Machine Learning for Scientific Computing",
+            authors=[Author("Smith, J.", given_name="J.", family_name="Smith")],
+            year=2023,
+            doi="10.1000/a",
+        )
+        other_doi = Publication(
+            title="Machine Learning in Scientific Computing",
+            authors=[Author("Smith, John", given_name="John", family_name="Smith")],
+            year=2023,
+            doi="10.1000/b",
+        )
+        no_doi = Publication(
+            title="Machine Learning in Scientific Computing",
+            authors=[Author("Smith, John", given_name="John", family_name="Smith")],
+            year=2023,
+        )
+
+        potential_matches = matcher.find_potential_matches(
+            [source_pub], [other_doi, no_doi]
+        )
+
+        assert [m.reference_publication for m in potential_matches] == [no_doi]
+
+    def test_find_potential_matches_reports_match_confidence(self, matcher):
+        """Test that potential matches carry match_publications' confidence."""
+        source_pubs = [
+            Publication(
+                title=title,
+                authors=[Author("Smith, J.", given_name="J.", family_name="Smith")],
+                year=year,
+                journal=journal,
+            )
+            for title, year, journal in [
+                ("Machine Learning for Scientific Computing", 2023, "J. Sci."),
+                ("Machine Learning: Scientific Computing!", 2022, None),
+                ("???", 2023, "..."),
+            ]
+        ]
+        reference_pubs = [
+            Publication(
+                title="Machine Learning in Scientific Computing",
+                authors=[Author("Smith, John", given_name="John", family_name="Smith")],
+                year=2023,
+                journal="J Sci",
+            ),
+            Publication(title="!!!", authors=[], year=2024, journal="!"),
+        ]
+
+        potential_matches = matcher.find_potential_matches(source_pubs, reference_pubs)
+
+        assert len(potential_matches) > 1
+        for match in potential_matches:
+            result = matcher.match_publications(
+                match.source_publication, match.reference_publication
+            )
+            assert match.confidence == result.confidence
+
+    def test_find_potential_matches_in_worker_processes(self, matcher, monkeypatch):
+        """Test that process-parallel scoring returns the serial result."""
+        source_pubs = [
+            Publication(
+                title=f"Machine Learning for Scientific Computing {suffix}",
+                authors=[Author("Smith, J.", given_name="J.", family_name="Smith")],
+                year=2021 + i % 3,
+                journal="Journal of Science",
+            )
+            for i, suffix in enumerate(["", "Methods", "Review", "", "I", "II"])
+        ]
+        reference_pubs = [
+            Publication(
+                title="Machine Learning in Scientific Computing",
+                authors=[Author("Smith, John", given_name="John", family_name="Smith")],
+                year=year,
+                journal="Science Journal",
+            )
+            for year in (2021, 2022, 2023)
+        ]
+        serial = matcher.find_potential_matches(source_pubs, reference_pubs)
+
+        monkeypatch.setattr(matcher_module, "_PARALLEL_MIN_PAIRS", 0)
+        monkeypatch.setattr(matcher_module, "_available_cpus", lambda: 2)
+        parallel = matcher.find_potential_matches(source_pubs, reference_pubs)
+
+        assert len(serial) > 1
+        assert [
+            (m.source_publication, m.reference_publication, m.confidence)
+            for m in parallel
+        ] == [
+            (m.source_publication, m.reference_publication, m.confidence)
+            for m in serial
+        ]
+        # Results refer to the caller's objects, not copies from the workers
+        assert any(parallel[0].source_publication is pub for pub in source_pubs)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            OSError("process creation not permitted"),
+            pickle.PicklingError("cannot pickle features"),
+        ],
+    )
+    def test_find_potential_matches_without_worker_processes(
+        self, matcher, monkeypatch, error
+    ):
+        """Test fallback to in-process scoring when the worker pool fails."""
+
+        def no_processes(*args, **kwargs):
+            raise error
+
+        source_pub = Publication(
+            title="Machine Learning for Scientific Computing",
+            authors=[Author("Smith, J.", given_name="J.", family_name="Smith")],
+            year=2023,
+        )
+        reference_pub = Publication(
+            title="Machine Learning in Scientific Computing",
+            authors=[Author("Smith, John", given_name="John", family_name="Smith")],
+            year=2023,
+        )
+        monkeypatch.setattr(matcher_module, "_PARALLEL_MIN_PAIRS", 0)
+        monkeypatch.setattr(matcher_module, "_available_cpus", lambda: 2)
+        monkeypatch.setattr(matcher_module, "ProcessPoolExecutor", no_processes)
+
+        potential_matches = matcher.find_potential_matches(
+            [source_pub], [reference_pub]
+        )
+
+        assert [m.reference_publication for m in potential_matches] == [reference_pub]
+
     def test_confidence_scoring(self, matcher):
         """Test confidence scoring algorithm."""
         # Perfect match
@@ -345,6 +480,77 @@ class TestPublicationMatcher:
 
         assert result_same.confidence > result_diff.confidence
 
+    def test_find_missing_indexed_matches_full_scan(self, matcher, sample_publications):
+        """Test that the candidate index gives the same result as a full scan."""
+        source = sample_publications
+        reference = list(reversed(sample_publications[1:]))
+
+        expected = [
+            pub
+            for pub in source
+            if not any(
+                matcher.match_publications(pub, ref).is_match for ref in reference
+            )
+        ]
+        assert matcher.find_missing(source, reference) == expected
+
+    def test_low_threshold_compares_every_pair(self):
+        """Test that no index is used when titles need not overlap to match."""
+        matcher = PublicationMatcher(similarity_threshold=0.5)
+        assert matcher._build_candidate_index([]) is None
+
+    def test_find_missing_doi_match_without_shared_title(self, matcher):
+        """Test that equal DOIs match even when titles share no words."""
+        pub1 = Publication(title="Original Title", authors=[], doi="10.1/ABC")
+        pub2 = Publication(title="Completely Different", authors=[], doi="10.1/abc")
+
+        assert matcher.find_missing([pub1], [pub2]) == []
+
+    def test_find_missing_different_dois_never_match(self):
+        """Test that differing DOIs decide the pair despite identical metadata."""
+        matcher = PublicationMatcher(similarity_threshold=0.5)
+        pub = Publication(
+            title="Machine Learning in Scientific Computing",
+            authors=[Author("Smith, John", given_name="John", family_name="Smith")],
+            year=2023,
+            journal="Journal of Science",
+            doi="10.1000/a",
+        )
+        other = Publication(
+            title=pub.title,
+            authors=pub.authors,
+            year=pub.year,
+            journal=pub.journal,
+            doi="10.1000/b",
+        )
+
+        assert matcher.find_missing([pub], [other]) == [pub]
+        assert matcher.find_duplicates([pub, other]) == []
+
+    def test_find_duplicates_groups_transitively(self):
+        """Test that chained matches form one group in input order."""
+        matcher = PublicationMatcher(similarity_threshold=0.75, year_tolerance=1)
+        authors = [Author("Smith, John", given_name="John", family_name="Smith")]
+        pubs = [
+            Publication(title="Deep Learning", authors=authors, year=year)
+            for year in (2020, 2022, 2021)
+        ]
+        unrelated = Publication(title="Quantum Chemistry", authors=[], year=2021)
+
+        # 2020 and 2022 are outside the year tolerance of each other
+        assert not matcher.match_publications(pubs[0], pubs[1]).is_match
+
+        assert matcher.find_duplicates([pubs[0], unrelated, *pubs[1:]]) == [pubs]
+
+    def test_find_duplicates_punctuation_only_titles(self, matcher):
+        """Test duplicates whose titles normalize to nothing are still found."""
+        pubs = [
+            Publication(title="???", authors=[Author("A B")], year=2020),
+            Publication(title="!!!", authors=[Author("A B")], year=2020),
+        ]
+
+        assert matcher.find_duplicates(pubs) == [pubs]
+
 
 class TestMatchResult:
     """Test cases for MatchResult class."""
@@ -1,5 +1,10 @@
 """Tests for publication models."""
 
+import dataclasses
+import sys
+
+import pytest
+
 from puby.models import Author, Publication, ZoteroConfig
 
 
@@ -29,10 +34,31 @@ class TestAuthor:
         author = Author(name="John Doe")
         assert str(author) == "John Doe"
 
+    def test_author_is_immutable_and_hashable(self):
+        """Test that authors are frozen and usable as dict/set keys."""
+        author = Author(name="John Doe", given_name="John", family_name="Doe")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            author.name = "Jane Doe"
+
+        same = Author(name="John Doe", given_name="John", family_name="Doe")
+        assert {author, same} == {author}
+
 
 class TestPublication:
     """Test Publication model."""
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots need Python 3.10"
+    )
+    def test_publication_uses_slots(self):
+        """Test that publications carry no per-instance __dict__."""
+        pub = Publication(title="Test", authors=[])
+        assert not hasattr(pub, "__dict__")
+
+        pub.year = 2023
+        assert pub.year == 2023
+
     def test_publication_creation(self):
         """Test creating a publication."""
         authors = [Author(name="John Doe"), Author(name="Jane Smith")]
@@ -350,6 +376,16 @@ class TestZoteroConfig:
         assert config.group_id == "12345"
         assert config.library_type == "group"
 
+    def test_zotero_config_is_immutable(self):
+        """Test that Zotero configuration cannot change after validation."""
+        config = ZoteroConfig(api_key="abcdef1234567890abcdef12", group_id="12345")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.api_key = "changed"
+        assert hash(config) == hash(
+            ZoteroConfig(api_key="abcdef1234567890abcdef12", group_id="12345")
+        )
+
     def test_zotero_config_validation_valid(self):
         """Test valid Zotero configuration validation."""
         config = ZoteroConfig(
@@ -579,6 +615,16 @@ class TestCitationKeyGeneration:
         )
         assert pub.generate_citation_key() == "Smith2023-123"
 
+    def test_generate_citation_key_en_dash_pages(self):
+        """Test citation key generation with an en dash page range."""
+        pub = Publication(
+            title="Test Publication",
+            authors=[Author(name="John Smith", family_name="Smith")],
+            year=2023,
+            pages="123\u2013130",
+        )
+        assert pub.generate_citation_key() == "Smith2023-123"
+
     def test_resolve_key_conflicts_no_conflict(self):
         """Test conflict resolution with no existing conflicts."""
         pub = Publication(
@@ -625,3 +671,23 @@ class TestCitationKeyGeneration:
         existing_keys = ["Smith2023", "Smith2023a"]
         key = pub.resolve_key_conflicts(existing_keys)
         assert key == "Smith2023b"
+
+    def test_resolve_key_conflicts_with_set(self):
+        """Test conflict resolution against a set of existing keys."""
+        pub = Publication(
+            title="Test Publication",
+            authors=[Author(name="John Smith", family_name="Smith")],
+            year=2023,
+        )
+        key = pub.resolve_key_conflicts({"Smith2023", "Smith2023a"})
+        assert key == "Smith2023b"
+
+    def test_to_bibtex_with_explicit_key(self):
+        """Test BibTeX generation with a resolved citation key."""
+        pub = Publication(
+            title="Test Publication",
+            authors=[Author(name="John Smith", family_name="Smith")],
+            year=2023,
+        )
+        bibtex = pub.to_bibtex("Smith2023a")
+        assert bibtex.startswith("@article{Smith2023a,")
@@ -129,6 +129,34 @@ class TestORCIDSource:
 
         assert len(publications) == 0
 
+    @responses.activate
+    def test_fetch_many_works_keeps_summary_order(self):
+        """Test that concurrently fetched work details keep summary order."""
+        put_codes = list(range(100, 120))
+        works_response = {
+            "group": [{"work-summary": [{"put-code": code}]} for code in put_codes]
+        }
+        responses.add(
+            responses.GET,
+            "https://pub.orcid.org/v3.0/0000-0000-0000-0000/works",
+            json=works_response,
+            status=200,
+        )
+        for code in put_codes:
+            responses.add(
+                responses.GET,
+                f"https://pub.orcid.org/v3.0/0000-0000-0000-0000/work/{code}",
+                json={"title": {"title": {"value": f"Work {code}"}}},
+                status=200,
+            )
+
+        source = ORCIDSource("0000-0000-0000-0000")
+        publications = source.fetch()
+
+        assert [pub.title for pub in publications] == [
+            f"Work {code}" for code in put_codes
+        ]
+
     @responses.activate
     def test_fetch_work_detail_error(self):
         """Test handling of work detail fetch errors."""
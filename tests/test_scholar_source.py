@@ -379,6 +379,13 @@ class TestScholarSource:
         assert "User-Agent" in headers
         assert "Mozilla" in headers["User-Agent"]  # Should look like a real browser
 
+    def test_user_agent_stable_per_source(self):
+        """Test that one source keeps the same User-Agent across requests."""
+        source = ScholarSource("ABC123")
+
+        user_agents = {source._get_headers()["User-Agent"] for _ in range(20)}
+        assert len(user_agents) == 1
+
     @responses.activate
     def test_parse_publication_with_complex_journal_info(self):
         """Test parsing publication with complex journal information."""
@@ -9,6 +9,7 @@ from puby.similarity_utils import (
     calculate_simple_similarity,
     calculate_title_similarity_with_length_penalty,
     normalize_text,
+    normalized_word_set,
 )
 
 
@@ -43,6 +44,25 @@ class TestNormalizeText:
         result = normalize_text("  padded text  ")
         assert result == "padded text"
 
+    def test_non_ascii_text(self):
+        """Test that non-ASCII letters are kept and Unicode punctuation removed."""
+        result = normalize_text("Über die Anwendung \u2013 «Maschinelles» Lernen_2")
+        assert result == "über die anwendung maschinelles lernen_2"
+
+
+class TestNormalizedWordSet:
+    """Test normalized_word_set function."""
+    
+    def test_word_set(self):
+        """Test words are taken from the normalized text."""
+        assert normalized_word_set("The GPU, the CPU!") == {"the", "gpu", "cpu"}
+        
+    def test_result_is_cached(self):
+        """Test repeated calls return the same cached frozenset."""
+        first = normalized_word_set("Cached Title")
+        assert isinstance(first, frozenset)
+        assert normalized_word_set("Cached Title") is first
+
 
 class TestCalculateJaccardSimilarity:
     """Test calculate_jaccard_similarity function."""
@@ -1,5 +1,6 @@
 """Integration tests for connection pooling in publication sources."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 
@@ -35,7 +36,7 @@ class TestORCIDSourceConnectionPooling:
         """Test that ORCID source reuses session for multiple API calls."""
         mock_session = Mock()
         mock_session.get.return_value.raise_for_status.return_value = None
-        mock_session.get.return_value.json.return_value = {"group": []}
+        mock_session.get.return_value.content = json.dumps({"group": []}).encode()
         mock_get_session.return_value = mock_session
         
         source = ORCIDSource("https://orcid.org/0000-0000-0000-0000")
@@ -160,7 +161,7 @@ class TestConnectionPoolingPerformance:
         # Multiple operations should reuse the same session
         with patch.object(source._session, 'get') as mock_get:
             mock_get.return_value.raise_for_status.return_value = None
-            mock_get.return_value.json.return_value = {"group": []}
+            mock_get.return_value.content = json.dumps({"group": []}).encode()
             
             source.fetch()
             
@@ -3,7 +3,6 @@
 import pytest
 
 from puby.utils import (
-    extract_year_from_bibtex_field,
     extract_year_from_text,
     safe_int_from_value,
 )
@@ -55,56 +54,6 @@ class TestExtractYearFromText:
         assert extract_year_from_text("Some random text") is None
 
 
-class TestExtractYearFromBibtexField:
-    """Test year extraction from BibTeX entries."""
-
-    def test_extracts_year_from_valid_bibtex(self):
-        """Test extraction from valid BibTeX year field."""
-        bibtex = "@article{key, year = {2023}, title = {Test}}"
-        assert extract_year_from_bibtex_field(bibtex) == 2023
-
-    def test_case_insensitive_field_matching(self):
-        """Test that field matching is case insensitive."""
-        bibtex = "@article{key, YEAR = {2023}, title = {Test}}"
-        assert extract_year_from_bibtex_field(bibtex) == 2023
-        
-        bibtex = "@article{key, Year = {2023}, title = {Test}}"
-        assert extract_year_from_bibtex_field(bibtex) == 2023
-
-    def test_handles_whitespace_variations(self):
-        """Test handling of various whitespace patterns."""
-        bibtex = "@article{key,year={2023},title={Test}}"
-        assert extract_year_from_bibtex_field(bibtex) == 2023
-        
-        bibtex = "@article{key, year   =   {2023}, title = {Test}}"
-        assert extract_year_from_bibtex_field(bibtex) == 2023
-
-    def test_extracts_first_year_field(self):
-        """Test that first year field is used when multiple present."""
-        bibtex = "@article{key, year = {2020}, year = {2023}}"
-        assert extract_year_from_bibtex_field(bibtex) == 2020
-
-    def test_handles_invalid_year_values(self):
-        """Test handling of invalid year values."""
-        bibtex = "@article{key, year = {not_a_year}}"
-        assert extract_year_from_bibtex_field(bibtex) is None
-
-    def test_handles_missing_year_field(self):
-        """Test handling when year field is missing."""
-        bibtex = "@article{key, title = {Test}}"
-        assert extract_year_from_bibtex_field(bibtex) is None
-
-    def test_handles_empty_or_none_input(self):
-        """Test handling of empty or None input."""
-        assert extract_year_from_bibtex_field("") is None
-        assert extract_year_from_bibtex_field(None) is None
-
-    def test_handles_year_with_extra_whitespace(self):
-        """Test handling year values with extra whitespace."""
-        bibtex = "@article{key, year = {  2023  }}"
-        assert extract_year_from_bibtex_field(bibtex) == 2023
-
-
 class TestSafeIntFromValue:
     """Test safe integer conversion utility."""
 
@@ -1,5 +1,6 @@
 """Tests for Zotero API client."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -60,12 +61,12 @@ class TestZoteroSource:
         # Mock the /keys/current endpoint response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "key": "abcdef1234567890abcdef12",
             "userID": 123456,
             "username": "testuser",
             "access": {"user": {"library": True, "notes": True, "write": True}},
-        }
+        }).encode()
         
         # Create config without user ID
         config = ZoteroConfig(api_key="abcdef1234567890abcdef12", library_type="user")
@@ -177,11 +178,11 @@ class TestZoteroSource:
         # Mock response without userID field
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "key": "abcdef1234567890abcdef12",
             # Missing userID field
             "username": "testuser",
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         # Create config without user ID
@@ -319,6 +320,51 @@ class TestZoteroSource:
         assert len(publications) == 2
         assert mock_client.everything.called
 
+    @patch("puby.zotero_source.zotero.Zotero")
+    def test_fetch_library_parallel_pages(self, mock_zotero):
+        """Test library pages after the first are fetched from Total-Results."""
+
+        def items(start, count):
+            return [
+                {
+                    "data": {
+                        "itemType": "journalArticle",
+                        "title": f"Publication {start + i + 1}",
+                        "date": "2023",
+                    }
+                }
+                for i in range(count)
+            ]
+
+        mock_client = Mock()
+        mock_client.top.return_value = items(0, 100)
+        mock_client.request = Mock(headers={"Total-Results": "250"})
+        mock_client.endpoint = "https://api.zotero.org"
+        mock_client.library_type = "groups"
+        mock_client.library_id = "12345"
+        mock_zotero.return_value = mock_client
+
+        pages = {100: items(100, 100), 200: items(200, 50)}
+        mock_session = Mock()
+        mock_session.get.side_effect = lambda url, headers, params: Mock(
+            content=json.dumps(pages[params["start"]]).encode()
+        )
+
+        config = ZoteroConfig(
+            api_key="abcdef1234567890abcdef56", group_id="12345", library_type="group"
+        )
+        with patch("puby.zotero_source.get_session_for_url", return_value=mock_session):
+            source = ZoteroSource(config)
+        publications = source.fetch()
+
+        mock_client.everything.assert_not_called()
+        assert mock_session.get.call_count == 2
+        url = mock_session.get.call_args.args[0]
+        assert url == "https://api.zotero.org/groups/12345/items/top"
+        assert [pub.title for pub in publications] == [
+            f"Publication {i}" for i in range(1, 251)
+        ]
+
     @patch("puby.zotero_source.zotero.Zotero")
     def test_fetch_publications_error_handling(self, mock_zotero):
         """Test error handling during fetch."""
@@ -767,7 +813,7 @@ class TestZoteroMyPublicationsEndpoint:
         # Mock API response for My Publications endpoint
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "data": {
                     "itemType": "journalArticle",
@@ -784,7 +830,7 @@ class TestZoteroMyPublicationsEndpoint:
                     "DOI": "10.1234/research.2023.123",
                 }
             }
-        ]
+        ]).encode()
         mock_requests_get.return_value = mock_response
 
         # Create source with My Publications enabled
@@ -1094,3 +1140,50 @@ class TestZoteroMyPublicationsEndpoint:
         # Should raise network error
         with pytest.raises(ValueError, match="Network error"):
             source.fetch()
+
+    @patch("puby.zotero_source.zotero.Zotero")
+    def test_fetch_my_publications_parallel_pages(self, mock_zotero):
+        """Test remaining pages are fetched from Total-Results in page order."""
+        mock_client = Mock()
+        mock_client.collections.return_value = []
+        mock_zotero.return_value = mock_client
+
+        def page(start, count):
+            items = [
+                {
+                    "data": {
+                        "itemType": "journalArticle",
+                        "title": f"Publication {start + i + 1}",
+                        "date": "2023",
+                    }
+                }
+                for i in range(count)
+            ]
+            return Mock(
+                status_code=200,
+                headers={"Total-Results": "250"},
+                content=json.dumps(items).encode(),
+            )
+
+        pages = {0: page(0, 100), 100: page(100, 100), 200: page(200, 50)}
+        mock_session = Mock()
+        mock_session.get.side_effect = lambda url, headers, params: pages[
+            params["start"]
+        ]
+
+        config = ZoteroConfig(
+            api_key="abcdef1234567890abcdef12",
+            group_id="123456",
+            library_type="user",
+            use_my_publications=True,
+        )
+        with patch("puby.zotero_source.get_session_for_url", return_value=mock_session):
+            source = ZoteroSource(config)
+        publications = source.fetch()
+
+        # One request per page; no extra request past Total-Results
+        assert mock_session.get.call_count == 3
+        assert len(publications) == 250
+        assert publications[0].title == "Publication 1"
+        assert publications[100].title == "Publication 101"
+        assert publications[249].title == "Publication 250"